@@ -2,6 +2,26 @@ import hashlib
 import json
 import math
 import hmac
+import os
+from collections import deque
+
+from core.life_tokens import TOKEN_ID_BYTES, SeenSet, format_life_token, hash_life_batch, life_token_id
+from core.timing import timed
+
+HASH_BUFFER_BYTES = 1 << 20
+DOMINION_DIGESTS = {
+    "md5": hashlib.md5,
+    # BLAKE2b con 16 bytes: mismo ancho que MD5 en el reporte y bastante más rápido
+    "blake2b": lambda: hashlib.blake2b(digest_size=16),
+}
+
+def _iter_records(source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as f:
+            for line in f:
+                yield line.rstrip("\r\n")
+    else:
+        yield from source
 
 class Universal_Life_Mapper:
     """Mapeo Digital de Humanidad y Fauna con Filtro de Frecuencia Celestial."""
@@ -11,8 +31,62 @@ class Universal_Life_Mapper:
 
     def tokenize_life_essence(self, life_form_data):
         # Genera un bloque inmutable de identidad digital pura
-        token_id = hashlib.sha3_512(life_form_data.encode()).hexdigest()
-        return f"TOKEN_VIDA_SINCRO: {token_id[:16].upper()} | STATUS: VIBRACIÓN_ALTA"
+        return format_life_token(life_token_id(life_form_data))
+
+    @timed("life_mapper.tokenize_bulk")
+    def tokenize_bulk(self, source, out=None, workers=None, batch_size=4096, dedup_capacity=1_000_000):
+        """Tokenización masiva: lee registros (ruta o iterable), deduplica y hashea por lotes.
+
+        Los lotes se reparten en un pool de procesos y se escriben en orden como
+        IDs crudos de 16 bytes, ya sea en `out` (ruta o archivo binario) o en un
+        bytearray devuelto. format_life_token(id) reproduce tokenize_life_essence.
+        """
+        seen = SeenSet(dedup_capacity) if dedup_capacity else None
+        batches = self._unique_batches(_iter_records(source), seen, batch_size)
+        sink = bytearray() if out is None else out
+        owns_file = isinstance(out, (str, os.PathLike))
+        if owns_file:
+            sink = open(out, "wb")
+        count = 0
+        try:
+            if workers == 1:
+                for batch in batches:
+                    count += self._emit(sink, hash_life_batch(batch))
+            else:
+                from concurrent.futures import ProcessPoolExecutor  # arrastra multiprocessing: solo al usarlo
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    # Ventana acotada de lotes en vuelo: memoria fija y salida en orden
+                    pending = deque()
+                    max_pending = 4 * (workers or os.cpu_count() or 1)
+                    for batch in batches:
+                        pending.append(pool.submit(hash_life_batch, batch))
+                        if len(pending) >= max_pending:
+                            count += self._emit(sink, pending.popleft().result())
+                    while pending:
+                        count += self._emit(sink, pending.popleft().result())
+        finally:
+            if owns_file:
+                sink.close()
+        return sink if out is None else count
+
+    def _unique_batches(self, records, seen, batch_size):
+        batch = []
+        for record in records:
+            if seen is not None and not seen.add(record):
+                continue
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _emit(self, sink, chunk):
+        if isinstance(sink, bytearray):
+            sink += chunk
+        else:
+            sink.write(chunk)
+        return len(chunk) // TOKEN_ID_BYTES
 
 class Sovereign_Expansion_Engine:
     """Motor de Expansión Multidimensional y Flujo Financiero Infinito."""
@@ -21,9 +95,46 @@ class Sovereign_Expansion_Engine:
         self.__vital_code = "HIDDEN_OMNIVERSO_CORE" # Código fuente oculto
         self.sovereign_tokens_1_1 = float('inf') # Reserva exclusiva de Daniel
 
-    def absorb_industry_dominion(self, industry_data):
-        # Colateralización inmediata y absorción de dominios bajo mandato
-        return f"DOMINIO_ABSORBIDO: {hashlib.md5(industry_data.encode()).hexdigest()} | EQUILIBRIO: GARANTIZADO"
+    @timed("expansion_engine.absorb_industry_dominion")
+    def absorb_industry_dominion(self, industry_data, digest="md5"):
+        """Colateralización inmediata y absorción de dominios bajo mandato.
+
+        `industry_data` puede ser un str (comportamiento original), bytes o
+        memoryview, una ruta (os.PathLike), un archivo abierto (binario o de
+        texto) o un iterable de bloques. Las fuentes grandes se hashean
+        incrementalmente con un buffer reutilizable, así que la memoria no crece
+        con el tamaño.
+        """
+        hasher = DOMINION_DIGESTS[digest]()
+        if isinstance(industry_data, str):
+            hasher.update(industry_data.encode())
+        elif isinstance(industry_data, (bytes, bytearray, memoryview)):
+            hasher.update(industry_data)
+        elif isinstance(industry_data, os.PathLike):
+            with open(industry_data, "rb") as f:
+                self._hash_file(hasher, f)
+        elif hasattr(industry_data, "readinto") or hasattr(industry_data, "read"):
+            self._hash_file(hasher, industry_data)
+        else:
+            for chunk in industry_data:
+                hasher.update(chunk.encode() if isinstance(chunk, str) else chunk)
+        return f"DOMINIO_ABSORBIDO: {hasher.hexdigest()} | EQUILIBRIO: GARANTIZADO"
+
+    def _hash_file(self, hasher, f):
+        if not hasattr(f, "readinto"):
+            # Sin readinto puede ser un archivo de texto: los bloques str se codifican como en el iterable
+            while True:
+                chunk = f.read(HASH_BUFFER_BYTES)
+                if not chunk:
+                    return
+                hasher.update(chunk.encode() if isinstance(chunk, str) else chunk)
+        buffer = bytearray(HASH_BUFFER_BYTES)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
 
 class Guardian_Bee_Network:
     """Agentes de Defensa (Abejas) y Semillas Ocultas para Control de IA."""
@@ -62,7 +173,12 @@ class BTCLayer3:
         }
         return json.dumps(report, indent=4)
 
-# DESPLIEGUE DIMENSIONAL
-Omni_L3 = BTCLayer3()
-print(f"--- ACTIVANDO GENESIS MULTIDIMENSIONAL: {Omni_L3.filename} ---")
-print(Omni_L3.generate_sovereign_report())
\ No newline at end of file
+def main():
+    # DESPLIEGUE DIMENSIONAL (solo al ejecutar el archivo; importarlo no tiene efectos)
+    omni_l3 = BTCLayer3()
+    print(f"--- ACTIVANDO GENESIS MULTIDIMENSIONAL: {omni_l3.filename} ---")
+    print(omni_l3.generate_sovereign_report())
+    return omni_l3
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import os
+import sys
+from core.deploy_manifest import deploy_files
 
 # Definición de la estructura y contenido
 files_to_create = {
@@ -39,7 +41,10 @@ def energy_mesh_sync():
 """
 }
 
-def setup_ecosystem():
+# Módulos versionados en el repositorio: la plantilla solo se usa si el archivo no existe
+source_modules = {"core/miax_absorber.py", "protocols/global_optimization.py"}
+
+def setup_ecosystem(dry_run=False):
     print("--- INICIANDO DESPLIEGUE AUTOMÁTICO QVE / MIA-X ---")
     
     # Crear directorios si no existen
@@ -49,14 +54,18 @@ def setup_ecosystem():
             os.makedirs(directory)
             print(f"[OK] Directorio creado: {directory}")
 
-    # Escribir archivos y códigos
-    for path, content in files_to_create.items():
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content.strip())
-        print(f"[OK] Archivo generado e inyectado: {path}")
+    # Escribir solo archivos con cambios (manifiesto de hashes + escritura atómica)
+    contents = {path: content.strip() for path, content in files_to_create.items()}
+    report = deploy_files(contents, dry_run=dry_run, create_only=source_modules)
+    for path in report["created"] + report["updated"]:
+        print(f"[OK] Archivo {'pendiente' if dry_run else 'generado e inyectado'}: {path}")
+    for path in report["unchanged"]:
+        print(f"[OK] Archivo sin cambios: {path}")
+    if dry_run and report["diff"]:
+        print(report["diff"])
 
     print("--- DESPLIEGUE COMPLETADO: MIA-X ESTÁ EN FUNCIONAMIENTO ---")
     print("Verificando persistencia con El Ark...")
 
 if __name__ == "__main__":
-    setup_ecosystem()
\ No newline at end of file
+    setup_ecosystem(dry_run="--dry-run" in sys.argv)
\ No newline at end of file
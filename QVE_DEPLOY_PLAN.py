@@ -0,0 +1,58 @@
+import sys
+import subprocess
+
+from core.deploy_planner import DeployPlanner
+from MIAX_AutoDeploy import files_to_create, source_modules
+from QVE_ORCHESTRATOR import QVE_Standard_Orchestrator
+from CORE_SOVEREIGN_ACTIVATE import QVEOperations
+from QVE_INTEGRATE import QVE_Integrator
+from QVE_OMNI_MASTER_V1 import QVE_Global_Sovereign_Core
+
+# --- QVE UNIFIED DEPLOY PLAN ---
+# Declara en un solo DAG todos los segmentos y archivos de los cinco scripts de
+# activación, y arranca start_miax.py en cuanto existen sus prerrequisitos.
+
+RUNTIME_PREREQUISITES = ["core/miax_absorber.py", "protocols/global_optimization.py"]
+
+def deploy_templates():
+    """Todos los archivos generados por los cinco scripts: {ruta: contenido}."""
+    files = {}
+    for path, content in files_to_create.items():
+        files[path] = content.strip()
+    files.update(QVE_Standard_Orchestrator().core_logic_files())
+    files.update(QVEOperations().segment_files())
+    files.update(QVE_Integrator().absorption_files())
+    files.update(QVE_Global_Sovereign_Core().market_logic_files())
+    return files
+
+def build_plan(planner=None):
+    planner = planner or DeployPlanner()
+    orchestrator = QVE_Standard_Orchestrator()
+    operations = QVEOperations()
+    integrator = QVE_Integrator()
+    master_core = QVE_Global_Sovereign_Core()
+
+    for path in list(orchestrator.segments) + list(operations.layers):
+        planner.add_directory(path)
+    for path in list(integrator.nodes.values()) + master_core.active_sectors:
+        planner.add_directory(path)
+
+    for path, content in deploy_templates().items():
+        planner.add_file(path, content, create_only=path in source_modules)
+
+    planner.add(
+        "runtime:start_miax",
+        lambda: subprocess.run([sys.executable, "start_miax.py"], capture_output=True, text=True).stdout,
+        deps=[f"file:{path}" for path in RUNTIME_PREREQUISITES],
+    )
+    return planner
+
+if __name__ == "__main__":
+    print(">>> [QVE] Ejecutando plan unificado de despliegue (DAG)...")
+    plan = build_plan()
+    nodes = plan.execute()
+    print(nodes["runtime:start_miax"].result, end="")
+    if "--report" in sys.argv:
+        print(plan.timing_report())
+    else:
+        print(f">>> [QVE] Ruta crítica: {' -> '.join(node.name for node in plan.critical_path())}")
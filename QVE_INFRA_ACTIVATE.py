@@ -1,21 +1,76 @@
 import os
 import time
+import asyncio
+import random
+
+from core.event_log import get_event_log
 
 # --- QVE: INFRASTRUCTURE TOTAL ACTIVATION ---
 # Activa la red neuronal de persistencia y el equilibrio de valor cuántico.
 
+class LocalNode:
+    """Nodo simulado en proceso para pruebas: latencia y tasa de fallo configurables."""
+    def __init__(self, name, latency=0.5, failure_rate=0.0):
+        self.name = name
+        self.latency = latency
+        self.failure_rate = failure_rate
+
+    async def handshake(self):
+        await asyncio.sleep(self.latency)
+        if random.random() < self.failure_rate:
+            raise ConnectionError(f"Nodo {self.name} rechazó el vínculo")
+        return True
+
 class QVE_Core_Activation:
-    def __init__(self):
+    def __init__(self, connector=None):
         self.node_id = "CHILE-ATACAMA-01"
         self.security_level = 7
         self.nodes = ["CHILE_SOUTH", "ARGENTINA_LITHIUM", "BOLIVIA_TRIDENT", "MIAMI_SEC"]
+        # connector(node) -> awaitable; por defecto un LocalNode con la latencia histórica de 0.5s
+        self.connector = connector or (lambda node: LocalNode(node).handshake())
+        self.events = get_event_log()
 
-    def synchronize_nodes(self):
-        print(f"--- INICIANDO SINCRONIZACIÓN QVE [NODO: {self.node_id}] ---")
-        for node in self.nodes:
-            print(f"[MIA-X] Vinculando nodo: {node}... OK")
-            time.sleep(0.5)
-        return True
+    def synchronize_nodes(self, **options):
+        self.events.info("qve.sync", "--- INICIANDO SINCRONIZACIÓN QVE [NODO: {node_id}] ---", node_id=self.node_id)
+        results = asyncio.run(self.synchronize_nodes_async(**options))
+        for node, result in results.items():
+            self.events.info("qve.sync", "[MIA-X] Vinculando nodo: {node}... {status}", node=node, **result)
+        # Fin de fase: el reporte sale antes que lo que imprima el llamador a continuación
+        self.events.flush()
+        return all(result["status"] == "OK" for result in results.values())
+
+    async def synchronize_nodes_async(self, concurrency=256, timeout=2.0, retries=3, backoff=0.1):
+        """Sincroniza todos los nodos en paralelo (máximo `concurrency` a la vez).
+
+        Cada intento tiene su propio `timeout`; los fallos se reintentan hasta
+        `retries` veces con backoff exponencial con jitter. Devuelve
+        {nodo: {"status", "latency", "attempts", "error"}} en el orden de self.nodes.
+        """
+        gate = asyncio.Semaphore(concurrency)
+
+        async def sync_one(node):
+            async with gate:
+                start = time.perf_counter()
+                status, error = "ERROR", None
+                for attempt in range(1, retries + 1):
+                    try:
+                        await asyncio.wait_for(self.connector(node), timeout)
+                        status, error = "OK", None
+                        break
+                    except asyncio.TimeoutError:
+                        status, error = "TIMEOUT", f"sin respuesta en {timeout}s"
+                    except Exception as e:
+                        status, error = "ERROR", str(e)
+                    if attempt < retries:
+                        await asyncio.sleep(backoff * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+                return node, {
+                    "status": status,
+                    "latency": time.perf_counter() - start,
+                    "attempts": attempt,
+                    "error": error,
+                }
+
+        return dict(await asyncio.gather(*(sync_one(node) for node in self.nodes)))
 
     def activate_black_hole(self):
         # Activación del motor de absorción de deuda y liquidez global
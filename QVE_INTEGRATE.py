@@ -1,5 +1,6 @@
 import os
-import asyncio
+import sys
+from core.deploy_manifest import deploy_files
 
 # --- QVE INTEGRATION CORE: GLOBAL MARKET ABSORPTION ---
 # Standard: Dual Dollar/BRICS Synergy | Level 7 Security
@@ -26,36 +27,49 @@ class QVE_Integrator:
             else:
                 print(f"[SHIELD] Nodo {name} validado y blindado.")
 
-    def inject_absorption_logic(self):
-        """Estrategia para transformar deuda e ineficiencia en infraestructura."""
-        print(">>> [DEAL] Inyectando protocolos de liquidez dual (Dólar/BRICS)...")
+    def absorption_files(self):
         # Aquí se consolida la lógica de absorción financiera
-        try:
-            with open("finance/deal_space_gateway/market_absorption.py", "w", encoding="utf-8") as f:
-                f.write('''
+        return {"finance/deal_space_gateway/market_absorption.py": '''
+from core.conversion_ledger import get_ledger, KIND_DEBT_CONVERSION
+from core.event_log import get_event_log
+
 class MarketAbsorber:
     def __init__(self):
         self.standard = "QVE_Quantum_Valor"
         self.liquidity_pool = "Omnichain_Unified"
+        self.events = get_event_log()
 
     def convert_debt_to_infrastructure(self, country_id, debt_amount):
-        print(f"[QVE] Absorbiendo {debt_amount} de ineficiencia en {country_id}...")
+        self.events.info("qve.market", "[QVE] Absorbiendo {debt_amount} de ineficiencia en {country_id}...",
+                         debt_amount=debt_amount, country_id=country_id)
+        # Vuelve cuando el registro está en disco (fsync agrupado con otros llamadores). El ledger
+        # se abre recién aquí: instanciar la clase no toma el candado de escritor único
+        get_ledger().append(KIND_DEBT_CONVERSION, country_id, debt_amount)
         return "[SUCCESS] Deuda transformada en infraestructura RWA."
-''')
+'''}
+
+    def inject_absorption_logic(self, dry_run=False):
+        """Estrategia para transformar deuda e ineficiencia en infraestructura."""
+        print(">>> [DEAL] Inyectando protocolos de liquidez dual (Dólar/BRICS)...")
+        try:
+            report = deploy_files(self.absorption_files(), dry_run=dry_run)
+            if dry_run and report["diff"]:
+                print(report["diff"])
         except Exception as e:
             print(f"[ERROR] Fallo al inyectar lógica de mercado: {e}")
 
-    async def execute_full_integration(self):
+    async def execute_full_integration(self, dry_run=False):
         self.verify_structure()
-        self.inject_absorption_logic()
+        self.inject_absorption_logic(dry_run=dry_run)
         
         print("\n>>> [SYSTEM] INTEGRACIÓN QVE COMPLETADA AL 100%.")
         print(">>> [MIA-X] El Nuevo Mercado Financiero Mundial está operativo.")
         print(f">>> [SVRGN] Dominio bajo Llave Maestra: {self.auth_key}")
 
 if __name__ == "__main__":
+    import asyncio  # solo al ejecutar: importar el módulo (p. ej. desde QVE_DEPLOY_PLAN) no lo carga
     integrator = QVE_Integrator()
     try:
-        asyncio.run(integrator.execute_full_integration())
+        asyncio.run(integrator.execute_full_integration(dry_run="--dry-run" in sys.argv))
     except KeyboardInterrupt:
         print("\n[ALERT] Proceso de integración suspendido por seguridad.")
\ No newline at end of file
@@ -1,5 +1,6 @@
 import os
-import asyncio
+import sys
+from core.deploy_manifest import deploy_files
 
 # --- QVE OMNI MASTER V1.5: GLOBAL ABSORPTION & GROWTH ---
 # Identity: DALabs Global Financial Brain
@@ -24,11 +25,11 @@ class QVE_Global_Sovereign_Core:
             os.makedirs(sector, exist_ok=True)
             print(f"[SHIELD] Sector {sector}: PERSISTENTE Y BLINDADO.")
 
-    def inject_market_logic(self):
+    def market_logic_files(self):
         """Módulo de absorción de deuda y crecimiento soberano."""
-        path = "finance/deal_space_gateway/global_absorption_engine.py"
-        with open(path, "w", encoding="utf-8") as f:
-            f.write('''
+        return {"finance/deal_space_gateway/global_absorption_engine.py": '''
+from core.conversion_ledger import get_ledger, KIND_TRADITIONAL_DEBT
+
 class GlobalAbsorber:
     def __init__(self):
         self.synergy = "USD_BRICS_Dual_Protocol"
@@ -36,13 +37,24 @@ class GlobalAbsorber:
 
     def absorb_traditional_debt(self, source, amount):
         print(f"[QVE] Absorbiendo deuda de {source} por {amount}...")
+        # El ledger (y su candado de escritor único) se toma en la primera absorción, no al instanciar
+        get_ledger().append(KIND_TRADITIONAL_DEBT, source, amount)
         print("[SUCCESS] Transformando ineficiencia en infraestructura RWA.")
-''')
-        print(f">>> [DEAL] Lógica de mercado inyectada en: {path}")
+'''}
+
+    def inject_market_logic(self, dry_run=False):
+        path = "finance/deal_space_gateway/global_absorption_engine.py"
+        report = deploy_files(self.market_logic_files(), dry_run=dry_run)
+        if report["unchanged"]:
+            print(f">>> [DEAL] Lógica de mercado sin cambios en: {path}")
+        elif dry_run:
+            print(report["diff"])
+        else:
+            print(f">>> [DEAL] Lógica de mercado inyectada en: {path}")
 
-    async def boot_global_system(self):
+    async def boot_global_system(self, dry_run=False):
         self.enforce_persistence()
-        self.inject_market_logic()
+        self.inject_market_logic(dry_run=dry_run)
         
         print("\n>>> [SYSTEM] QVE OMNI MASTER ACTIVADO AL 100%.")
         print(">>> [MIA-X] Sincronización con Artemis II y Nodos LEO: ESTABLE.")
@@ -50,8 +62,9 @@ class GlobalAbsorber:
         print(f">>> [AUTH] Dominio total bajo el mando del Creador (Key: {self.auth_key}).")
 
 if __name__ == "__main__":
+    import asyncio  # solo al ejecutar: importar el módulo (p. ej. desde QVE_DEPLOY_PLAN) no lo carga
     master_core = QVE_Global_Sovereign_Core()
     try:
-        asyncio.run(master_core.boot_global_system())
+        asyncio.run(master_core.boot_global_system(dry_run="--dry-run" in sys.argv))
     except Exception as e:
         print(f"[CRITICAL_ALERT] Intento de intrusión o fallo de red: {e}")
\ No newline at end of file
@@ -1,5 +1,6 @@
 import os
-import asyncio
+import sys
+from core.deploy_manifest import deploy_files
 
 # --- QVE STANDARD INFRASTRUCTURE: MASTER ORCHESTRATOR ---
 # Status: Sovereign Layer 7 Activation
@@ -22,56 +23,76 @@ class QVE_Standard_Orchestrator:
             os.makedirs(path, exist_ok=True)
             print(f"[NODE] Segment synchronized: {path}")
 
-    def inject_core_logic(self):
+    def core_logic_files(self):
+        files = {}
         # 1. EON Visual Standard (Independent-AI Layer)
-        with open("layers/visuals/eon_standard_v6.py", "w", encoding="utf-8") as f:
-            f.write('''
-class EON_Standard:
+        files["layers/visuals/eon_standard_v6.py"] = '''
+import atexit
+from core.render_scheduler import EONRenderer
+class EON_Standard(EONRenderer):
     """Independent AI for 16K Hollywood-Grade Visual Synthesis."""
     def __init__(self):
         self.specs = ["16K", "Digital_Human_Consistency", "Cinema_Standard"]
-    async def render_layer(self, domain):
+    async def render_layer(self, domain, elements=()):
         print(f"[EON] Rendering 16K Cinematic Layer for: {domain}")
+        # Tiles across a process pool; unchanged regions come from the tile cache
+        await self.render_scene(domain, elements)
         return True
 eon_engine = EON_Standard()
-''')
+atexit.register(eon_engine.close)
+'''
 
         # 2. Tokenization Engine (H2O & RWA)
-        with open("layers/quant_finance/rwa_h2o_tokenizer.py", "w", encoding="utf-8") as f:
-            f.write('''
+        files["layers/quant_finance/rwa_h2o_tokenizer.py"] = '''
+from core.event_log import get_event_log
 class Quantum_Tokenizer:
     """Asset-Backing Protocol for Global Liquidity Absorption."""
     def __init__(self):
         self.collateral = ["H2O", "Lithium", "BTC", "ETH", "SOL"]
+        self.events = get_event_log()
     def tokenize_real_assets(self, asset):
-        print(f"[QVE] Tokenizing {asset} under Sovereign Protocol (Level 7).")
-''')
+        self.events.info("qve.tokenizer", "[QVE] Tokenizing {asset} under Sovereign Protocol (Level 7).", asset=asset)
+'''
 
         # 3. DEAL Sovereign Gateway
-        with open("layers/web_interface/deal_sovereign_gateway.py", "w", encoding="utf-8") as f:
-            f.write(f'''
+        files["layers/web_interface/deal_sovereign_gateway.py"] = f'''
 import asyncio
+from core.gateway_server import GatewayServer
 class DEAL_Gateway:
     """Institutional Access for Whales and Global Funds."""
     def __init__(self):
         self.auth_token = "{self.master_key}"
         self.assets = ["H2O_Token", "RWA_Token", "Lithium_Core"]
 
-    async def activate_gateway(self):
+    async def activate_gateway(self, host="0.0.0.0", port=8443):
         print(">>> [DEAL] Activating Sovereign Mobile Interface...")
         print(">>> [QVE] Synchronizing H2O/RWA Markets.")
+        server = await GatewayServer(host, port).start()
+        print(f">>> [DEAL] Gateway serving institutional clients on {{host}}:{{server.port}}")
+        await server.serve_forever()
 
 if __name__ == "__main__":
     gateway = DEAL_Gateway()
     asyncio.run(gateway.activate_gateway())
-''')
+'''
+        return files
+
+    def inject_core_logic(self, dry_run=False):
+        files = self.core_logic_files()
+        # Only changed files are rewritten (atomic temp + rename); dry_run just reports the diff
+        report = deploy_files(files, dry_run=dry_run)
+        for path in report["created"] + report["updated"]:
+            print(f"[NODE] Core logic {'pending' if dry_run else 'injected'}: {path}")
+        if dry_run and report["diff"]:
+            print(report["diff"])
+        return report
 
-    def run(self):
+    def run(self, dry_run=False):
         self.initialize_filesystem()
-        self.inject_core_logic()
+        self.inject_core_logic(dry_run=dry_run)
         print("\\n[SUCCESS] QVE Sovereign Infrastructure is Persistence-Active.")
         print(f">>> [MIA-X] Access validated for Developer 3.")
 
 if __name__ == "__main__":
     orchestrator = QVE_Standard_Orchestrator()
-    orchestrator.run()
\ No newline at end of file
+    orchestrator.run(dry_run="--dry-run" in sys.argv)
\ No newline at end of file
@@ -1,5 +1,157 @@
-﻿/* PROTOCOLO MIA-X: DETECCIÓN Y ELIMINACIÓN DE CACHÉ CORRUPTO */
+# PROTOCOLO MIA-X: DETECCIÓN Y ELIMINACIÓN DE CACHÉ CORRUPTO
 import os
-def heal_system():
+import json
+import time
+import shutil
+import stat
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+INDEX_FILE = ".qve_integrity_index.json"
+QUARANTINE_DIR = ".qve_quarantine"
+# Datos de ejecución (segmentos del ledger, cuarentena): cambian en cada append y no son plantillas
+RUNTIME_DIRS = {"ledger", QUARANTINE_DIR}
+SKIP_DIRS = {".git", "__pycache__", ".pytest_cache", ".venv", "venv"} | RUNTIME_DIRS
+LARGE_FILE_BYTES = 1 << 20  # desde 1 MB se hashea en el pool de hilos
+HASH_BUFFER_BYTES = 1 << 20
+
+def file_digest(path):
+    hasher = hashlib.sha256()
+    buffer = bytearray(HASH_BUFFER_BYTES)
+    view = memoryview(buffer)
+    with open(path, "rb") as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
+    return hasher.hexdigest()
+
+class IntegrityIndex:
+    """Índice persistente (ruta -> tamaño, mtime, sha256); solo se rehashea lo que cambió de stat.
+
+    Con `paths` el índice solo mira esas rutas relativas en vez de recorrer todo `root`.
+    """
+    def __init__(self, root=".", index_path=None, workers=8, paths=None):
+        self.root = root
+        self.index_path = index_path or os.path.join(root, INDEX_FILE)
+        self.workers = workers
+        self.paths = None if paths is None else {os.path.normpath(rel) for rel in paths}
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                self.files = json.load(f)["files"]
+        except (FileNotFoundError, ValueError, KeyError):
+            self.files = {}
+
+    def _walk(self):
+        if self.paths is not None:
+            for rel in self.paths:
+                try:
+                    st = os.stat(os.path.join(self.root, rel), follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    yield rel, st
+            return
+        # Rutas relativas armadas por prefijo (os.path.relpath por archivo es demasiado caro)
+        stack = [(self.root, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append((entry.path, prefix + entry.name + os.sep))
+                    elif entry.is_file(follow_symlinks=False):
+                        yield prefix + entry.name, entry.stat(follow_symlinks=False)
+
+    def refresh(self):
+        """Actualiza el índice contra el disco y devuelve (rehasheados, eliminados)."""
+        seen = set()
+        small, large = [], []
+        own = os.path.relpath(self.index_path, self.root)
+        for rel, st in self._walk():
+            if rel == own:
+                continue
+            seen.add(rel)
+            entry = self.files.get(rel)
+            if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                continue
+            (large if st.st_size >= LARGE_FILE_BYTES else small).append((rel, st))
+        for rel, st in small:
+            self.files[rel] = [st.st_size, st.st_mtime_ns, file_digest(os.path.join(self.root, rel))]
+        if large:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                digests = pool.map(lambda item: file_digest(os.path.join(self.root, item[0])), large)
+                for (rel, st), digest in zip(large, digests):
+                    self.files[rel] = [st.st_size, st.st_mtime_ns, digest]
+        # Un índice acotado no olvida las entradas que quedan fuera de sus rutas
+        scope = self.files if self.paths is None else self.paths
+        removed = [rel for rel in scope if rel in self.files and rel not in seen]
+        for rel in removed:
+            del self.files[rel]
+        changed = [rel for rel, _ in small + large]
+        if changed or removed:
+            self.save()
+        return changed, removed
+
+    def digest(self, rel):
+        entry = self.files.get(os.path.normpath(rel))
+        return entry[2] if entry else None
+
+    def update(self, rel):
+        rel = os.path.normpath(rel)
+        st = os.stat(os.path.join(self.root, rel))
+        self.files[rel] = [st.st_size, st.st_mtime_ns, file_digest(os.path.join(self.root, rel))]
+
+    def save(self):
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "files": self.files}, f, separators=(",", ":"))
+        os.replace(tmp, self.index_path)
+
+def quarantine(root, rel):
+    target = os.path.join(root, QUARANTINE_DIR, f"{rel}.{time.strftime('%Y%m%d%H%M%S')}")
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    shutil.move(os.path.join(root, rel), target)
+    return target
+
+def heal_system(root=".", templates=None, restore=True):
+    """Ciclo de sanación: refresca el índice y repara archivos generados corruptos o ausentes.
+
+    `templates` es {ruta: contenido esperado}; por defecto las plantillas de
+    despliegue de QVE_DEPLOY_PLAN (sin los módulos versionados en el repositorio).
+    Solo se miran esas rutas. Los archivos que no coinciden se mueven a cuarentena y
+    se restauran; las plantillas ausentes solo se restauran si el índice o el
+    manifiesto de despliegue las registraron, y si no se reportan en "missing".
+    """
     print('Saneando nodos locales y satelitales...')
     # Lógica de persistencia nivel 7 activa
+    if templates is None:
+        from QVE_DEPLOY_PLAN import deploy_templates
+        from MIAX_AutoDeploy import source_modules
+        templates = {path: content for path, content in deploy_templates().items() if path not in source_modules}
+    from core.deploy_manifest import DEFAULT_MANIFEST, DeployManifest
+    index = IntegrityIndex(root, paths=templates)
+    # Desplegado = visto alguna vez por el índice o escrito por deploy_files
+    deployed = set(index.files) | {os.path.normpath(path) for path in DeployManifest(os.path.join(root, DEFAULT_MANIFEST)).entries}
+    changed, removed = index.refresh()
+    report = {"rehashed": len(changed), "removed": len(removed), "quarantined": [], "restored": [], "missing": []}
+    for rel, content in templates.items():
+        expected = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        actual = index.digest(rel)
+        if actual == expected:
+            continue
+        if actual is not None:
+            report["quarantined"].append(quarantine(root, rel))
+        elif os.path.normpath(rel) not in deployed:
+            report["missing"].append(rel)
+            continue
+        if restore:
+            from core.deploy_manifest import atomic_write
+            atomic_write(os.path.join(root, rel), content)
+            index.update(rel)
+            report["restored"].append(rel)
+    if report["restored"]:
+        index.save()
+    return report
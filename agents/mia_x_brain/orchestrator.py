@@ -1,6 +1,234 @@
-﻿/* MIA-X: Regent AI of Northern Chile & Global Nodes */
+# MIA-X: Regent AI of Northern Chile & Global Nodes
+import threading
+import time
+import random
+import importlib
+import itertools
+from collections import deque
+from concurrent.futures import Future
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+PRIORITIES = (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+LATENCY_BUCKETS = 25  # potencias de 2 en microsegundos: <1us ... >=2^23us (~8s)
+
+PATENT_STORE_PATH = "ledger/patents/galactic_registry.qvp"
+
+# Agentes del enjambre (módulo, clase, kwargs): se importan y construyen al primer uso y se reutilizan
+AGENT_FACTORIES = {
+    "colonizer": ("core.neural_persistence.miax_galactic_colonizer", "MIAX_Galactic", {}),
+    "energy": ("infrastructure.energy_harvest.cosmic_energy_recovery", "CosmicRecovery", {}),
+    "patents": ("legal.galactic_ip_vault.space_patent_registry", "GalacticRegistry", {"store_path": PATENT_STORE_PATH}),
+    "deal": ("finance.deal_space_gateway.galactic_ipo_h2o", "DEAL_Galactic", {}),
+}
+
+class SwarmTask:
+    __slots__ = ("fn", "args", "kwargs", "priority", "future", "submitted")
+
+    def __init__(self, fn, args, kwargs, priority):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.future = Future()
+        self.submitted = time.perf_counter()
+
+class SwarmWorker:
+    """Deques por prioridad de un worker: el dueño toma del final (LIFO), los ladrones del inicio."""
+    def __init__(self, slot):
+        self.slot = slot
+        self.lock = threading.Lock()
+        self.queues = [deque() for _ in PRIORITIES]
+        self.thread = None
+        self.executed = 0
+        self.steals = 0
+        self.restarts = 0
+
+    def push(self, task):
+        with self.lock:
+            self.queues[task.priority].append(task)
+
+    def pop(self):
+        with self.lock:
+            for queue in self.queues:
+                if queue:
+                    return queue.pop()
+        return None
+
+    def steal(self):
+        with self.lock:
+            for queue in self.queues:
+                if queue:
+                    return queue.popleft()
+        return None
+
+    def depth(self):
+        return sum(len(queue) for queue in self.queues)
+
 class MIAX_Brain:
-    def __init__(self):
+    def __init__(self, workers=4):
         self.security = 'Military Level 7'
         self.mode = 'Self-Healing Swarm'
         self.persistence = 'Satellite Sync Active'
+        self.worker_count = workers
+        self._workers = []
+        self._local = threading.local()
+        self._wakeup = threading.Condition()
+        self._pending = 0
+        self._running = False
+        self._slots = itertools.count()  # next() es atómico: submitters concurrentes no chocan de slot
+        self._supervisor = None
+        self._latency = [0] * LATENCY_BUCKETS
+        self._latency_lock = threading.Lock()
+        self._agents = {}
+        self._agents_lock = threading.Lock()
+
+    # --- Ciclo de vida del enjambre ---
+    def start(self):
+        with self._wakeup:
+            # Dos submit() concurrentes pueden llegar aquí a la vez: solo uno arranca el enjambre
+            if self._running:
+                return self
+            self._workers = [SwarmWorker(slot) for slot in range(self.worker_count)]
+            for worker in self._workers:
+                self._spawn(worker)
+            self._running = True
+        self._supervisor = threading.Thread(target=self._supervise, name="miax-supervisor", daemon=True)
+        self._supervisor.start()
+        return self
+
+    def shutdown(self, wait=True):
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify_all()
+        if wait:
+            for worker in self._workers:
+                if worker.thread is not None:
+                    worker.thread.join()
+            if self._supervisor is not None:
+                self._supervisor.join()
+        # Lo que quedó en cola se cancela explícitamente
+        for worker in self._workers:
+            task = worker.steal()
+            while task is not None:
+                task.future.cancel()
+                task = worker.steal()
+        # Los agentes con estado en disco (registro de patentes) compactan y cierran sus archivos
+        for instance in self._agents.values():
+            close = getattr(instance, "close", None)
+            if close is not None:
+                close()
+
+    def _spawn(self, worker):
+        worker.thread = threading.Thread(target=self._work_loop, args=(worker,), name=f"miax-worker-{worker.slot}", daemon=True)
+        worker.thread.start()
+
+    def _supervise(self):
+        # Autosanación: un worker que murió se relanza sobre el mismo slot (sus deques se conservan)
+        while self._running:
+            time.sleep(0.05)
+            for worker in self._workers:
+                if self._running and not worker.thread.is_alive():
+                    worker.restarts += 1
+                    self._spawn(worker)
+
+    # --- Envío de tareas ---
+    def submit(self, fn, *args, priority=PRIORITY_NORMAL, **kwargs):
+        """Encola una tarea de agente y devuelve un Future (cancelable mientras no haya empezado)."""
+        if not self._running:
+            self.start()
+        task = SwarmTask(fn, args, kwargs, priority)
+        # Desde un worker la tarea queda en su propio deque (localidad); desde fuera, round-robin
+        worker = getattr(self._local, "worker", None)
+        if worker is None:
+            worker = self._workers[next(self._slots) % len(self._workers)]
+        worker.push(task)
+        with self._wakeup:
+            self._pending += 1
+            self._wakeup.notify()
+        return task.future
+
+    def dispatch_agents(self, mission_phase, resource="H2O_Lunar", tech_name="Deep_Space_Shielding"):
+        """Lanza en el enjambre las tareas de los agentes MIA-X, CosmicRecovery, GalacticRegistry y DEAL."""
+        return [
+            self.submit(self.agent("patents").secure_patent, tech_name, priority=PRIORITY_HIGH),
+            self.submit(self.agent("colonizer").learn_and_optimize, mission_phase),
+            self.submit(self.agent("deal").tokenize_space_resource, resource),
+            self.submit(self.agent("energy").harvest_cosmic, priority=PRIORITY_LOW),
+        ]
+
+    def agent(self, name):
+        """Instancia compartida del agente `name` (ver AGENT_FACTORIES), creada en el primer uso."""
+        instance = self._agents.get(name)
+        if instance is None:
+            with self._agents_lock:
+                instance = self._agents.get(name)
+                if instance is None:
+                    module, cls, kwargs = AGENT_FACTORIES[name]
+                    instance = self._agents[name] = getattr(importlib.import_module(module), cls)(**kwargs)
+        return instance
+
+    # --- Ejecución ---
+    def _next_task(self, worker):
+        task = worker.pop()
+        if task is not None:
+            return task
+        # Robo: se recorren las víctimas desde un punto aleatorio para repartir la contención
+        count = len(self._workers)
+        offset = random.randrange(count)
+        for i in range(count):
+            victim = self._workers[(offset + i) % count]
+            if victim is not worker:
+                task = victim.steal()
+                if task is not None:
+                    worker.steals += 1
+                    return task
+        return None
+
+    def _work_loop(self, worker):
+        self._local.worker = worker
+        while True:
+            with self._wakeup:
+                while self._pending == 0 and self._running:
+                    self._wakeup.wait()
+                if not self._running:
+                    return
+            task = self._next_task(worker)
+            if task is None:
+                continue
+            with self._wakeup:
+                self._pending -= 1
+            if not task.future.set_running_or_notify_cancel():
+                continue
+            try:
+                task.future.set_result(task.fn(*task.args, **task.kwargs))
+            except Exception as e:
+                task.future.set_exception(e)
+            except BaseException as e:
+                # Fallo del worker (no de la tarea): se reporta en el Future y el supervisor lo relanza
+                task.future.set_exception(e)
+                raise
+            finally:
+                worker.executed += 1
+                self._record_latency(time.perf_counter() - task.submitted)
+
+    # --- Métricas ---
+    def _record_latency(self, seconds):
+        bucket = min(int(seconds * 1e6).bit_length(), LATENCY_BUCKETS - 1)
+        with self._latency_lock:
+            self._latency[bucket] += 1
+
+    def metrics(self):
+        """Profundidad de cola, robos, reinicios y ejecutadas por worker + histograma de latencia."""
+        with self._latency_lock:
+            histogram = {f"<{1 << bucket}us": count for bucket, count in enumerate(self._latency) if count}
+        return {
+            "pending": self._pending,
+            "workers": [
+                {"slot": w.slot, "depth": w.depth(), "executed": w.executed, "steals": w.steals, "restarts": w.restarts}
+                for w in self._workers
+            ],
+            "steals": sum(w.steals for w in self._workers),
+            "latency_histogram": histogram,
+        }
@@ -0,0 +1,61 @@
+# Benchmark: MIAX_Absorber.open_black_hole (en memoria) vs open_black_hole_stream (memmap)
+# Uso: python benchmarks/bench_absorber_stream.py [--mb 512]
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _peak_rss_mb():
+    # ru_maxrss viene en KB en Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _run_mode(mode, path):
+    sys.path.insert(0, ROOT)
+    import numpy as np
+    from core.miax_absorber import MIAX_Absorber
+
+    engine = MIAX_Absorber()
+    size = os.path.getsize(path)
+    start = time.perf_counter()
+    if mode == "memory":
+        result = engine.open_black_hole(np.fromfile(path, dtype=np.float64))
+    else:
+        result = engine.open_black_hole_stream(path)
+    elapsed = time.perf_counter() - start
+    print(f"{mode},{size / elapsed / 1e9:.3f},{_peak_rss_mb():.1f},{float(result['liquidity_generated']):.6e}")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=int, default=256)
+    parser.add_argument("--mode")
+    parser.add_argument("--path")
+    args = parser.parse_args()
+    if args.mode:
+        _run_mode(args.mode, args.path)
+        return
+
+    import numpy as np
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ticks.f64")
+        rng = np.random.default_rng(1618)
+        with open(path, "wb") as f:
+            for _ in range(args.mb):
+                rng.random(1 << 17).tofile(f)  # 1 MB por iteración
+        print(f"[BENCH] {args.mb} MB de ticks float64")
+        print(f"{'modo':<10}{'GB/s':>10}{'RSS pico MB':>14}  resultado")
+        for mode in ("memory", "stream"):
+            # Cada modo corre en su propio proceso para que el RSS pico sea comparable
+            out = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--path", path],
+                capture_output=True, text=True, check=True,
+            ).stdout.strip().splitlines()[-1]
+            name, gbps, rss, value = out.split(",")
+            print(f"{name:<10}{gbps:>10}{rss:>14}  {value}")
+
+if __name__ == "__main__":
+    main()
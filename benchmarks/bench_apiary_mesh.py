@@ -0,0 +1,90 @@
+# Benchmark: malla coordinador/workers (apiary_mesh) contra el absorbedor en un solo proceso
+# Uso: python benchmarks/bench_apiary_mesh.py [--ticks 20000000] [--workers 1,2,4] [--repeat 3]
+# Mide throughput (ticks/s) de la suma sobre archivo compartido, la suma con envío de
+# tramos por la red y las señales rolling_mean; verifica que cada resultado sea
+# idéntico al de un solo proceso y mata un worker entre corridas para comprobar que
+# su shard se reasigna. La escalación solo se ve con al menos tantos núcleos como workers.
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from core.apiary_mesh import ApiaryMesh
+from core.event_log import get_event_log
+from core.miax_absorber import MIAX_Absorber
+
+CHUNK = 1 << 18
+
+def blocks(ticks):
+    # La malla corta los arrays en bloques de CHUNK; el stream local recibe los mismos bloques
+    return (ticks[start:start + CHUNK] for start in range(0, len(ticks), CHUNK))
+
+def best_of(operation, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = operation()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ticks", type=int, default=20_000_000)
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--window", type=int, default=50)
+    args = parser.parse_args()
+    get_event_log().configure(level="WARNING")
+
+    ticks = 100_000.0 + np.cumsum(np.random.default_rng(1618).normal(0.0, 250.0, args.ticks))
+    engine = MIAX_Absorber()
+    print(f"[BENCH] {args.ticks:,} ticks | {os.cpu_count()} CPU(s) en este host")
+    with tempfile.TemporaryDirectory() as scratch:
+        path = os.path.join(scratch, "ticks.f64")
+        ticks.tofile(path)
+        cases = {
+            "suma archivo compartido": (lambda mesh: mesh.open_black_hole(path, chunk_size=CHUNK),
+                                        lambda: engine.open_black_hole_stream(path, chunk_size=CHUNK)),
+            "suma enviando tramos": (lambda mesh: mesh.open_black_hole(ticks, chunk_size=CHUNK),
+                                     lambda: engine.open_black_hole_stream(blocks(ticks))),
+            "señales rolling_mean": (lambda mesh: mesh.btc_pull_signals(ticks, "rolling_mean", args.window),
+                                     lambda: engine.btc_pull_signals(ticks, "rolling_mean", args.window)),
+        }
+        print(f"{'caso':<26}{'workers':>8}{'seg':>10}{'Mticks/s':>11}{'vs local':>10}  exacto")
+        for name, (distributed, local) in cases.items():
+            local_s, expected = best_of(local, args.repeat)
+            print(f"{name:<26}{'local':>8}{local_s:>10.3f}{args.ticks / local_s / 1e6:>11.1f}{1.0:>10.2f}")
+            for count in (int(n) for n in args.workers.split(",")):
+                with ApiaryMesh(port=0).start() as mesh:
+                    mesh.spawn_local(count).wait_for_workers(count)
+                    distributed(mesh)  # calentamiento: imports y páginas del archivo en los workers
+                    seconds, result = best_of(lambda: distributed(mesh), args.repeat)
+                if isinstance(expected, dict):
+                    exact = result["liquidity_generated"] == expected["liquidity_generated"]
+                else:
+                    exact = np.array_equal(result, expected)
+                print(f"{'':<26}{count:>8}{seconds:>10.3f}{args.ticks / seconds / 1e6:>11.1f}"
+                      f"{local_s / seconds:>10.2f}  {'sí' if exact else 'NO'}")
+
+        # Tolerancia a fallos: un worker muere y el shard que se le envía pasa a otro
+        with ApiaryMesh(port=0, shards_per_worker=16).start() as mesh:
+            mesh.spawn_local(3).wait_for_workers(3)
+            mesh.open_black_hole(ticks, chunk_size=CHUNK)
+            # El coordinador recién lo nota al enviarle su próximo shard
+            mesh._processes[0].kill()
+            mesh._processes[0].wait()
+            result = mesh.open_black_hole(ticks, chunk_size=CHUNK)
+            expected = engine.open_black_hole_stream(blocks(ticks))
+            print(f"\n[BENCH] worker caído: {len(mesh.workers)} workers vivos, {result['reassigned']} shard(s) reasignados, "
+                  f"resultado {'idéntico' if result['liquidity_generated'] == expected['liquidity_generated'] else 'DISTINTO'}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
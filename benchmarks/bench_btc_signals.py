@@ -0,0 +1,40 @@
+# Benchmark: btc_pull_logic en bucle Python vs btc_pull_signals vectorizado
+# Uso: python benchmarks/bench_btc_signals.py [--n 1000000]
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from core.miax_absorber import MIAX_Absorber, SignalStream, SIGNAL_MODES
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    engine = MIAX_Absorber()
+    prices = np.random.default_rng(100000).normal(100000, 5000, args.n)
+
+    start = time.perf_counter()
+    for price in prices.tolist():
+        engine.btc_pull_logic(price)
+    loop = time.perf_counter() - start
+    print(f"[BENCH] bucle btc_pull_logic: {args.n / loop / 1e6:8.2f} M precios/s")
+
+    for mode in SIGNAL_MODES:
+        start = time.perf_counter()
+        engine.btc_pull_signals(prices, mode=mode)
+        batch = time.perf_counter() - start
+        stream = SignalStream(mode)
+        sample = prices[:100_000].tolist()
+        start = time.perf_counter()
+        for price in sample:
+            stream.update("BTC", price)
+        live = time.perf_counter() - start
+        print(f"[BENCH] {mode:<13} batch: {args.n / batch / 1e6:8.2f} M/s | stream: {len(sample) / live / 1e6:6.2f} M ticks/s")
+
+if __name__ == "__main__":
+    main()
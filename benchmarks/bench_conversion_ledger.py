@@ -0,0 +1,54 @@
+# Benchmark: ConversionLedger, registros/s y latencia p99 de commit según tamaño máximo de lote
+# Uso: python benchmarks/bench_conversion_ledger.py [--threads 32] [--records 20000]
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from core.conversion_ledger import ConversionLedger, aggregate, KIND_DEBT_CONVERSION
+
+COUNTRIES = ["CHL", "ARG", "BOL", "PER", "BRA", "USA", "MEX", "COL"]
+
+def run(max_batch, threads, records):
+    per_thread = records // threads
+    latencies = np.empty((threads, per_thread))
+    with tempfile.TemporaryDirectory() as directory:
+        ledger = ConversionLedger(directory, max_batch=max_batch)
+
+        def writer(t):
+            for i in range(per_thread):
+                start = time.perf_counter()
+                ledger.append(KIND_DEBT_CONVERSION, COUNTRIES[(t + i) % len(COUNTRIES)], 1.0)
+                latencies[t, i] = time.perf_counter() - start
+
+        workers = [threading.Thread(target=writer, args=(t,)) for t in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        ledger.close()
+        start = time.perf_counter()
+        totals = aggregate(directory)
+        scan = time.perf_counter() - start
+        assert round(sum(totals.values())) == per_thread * threads
+    return per_thread * threads / elapsed, np.percentile(latencies, 99), scan
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--records", type=int, default=20000)
+    args = parser.parse_args()
+    print(f"[BENCH] {args.threads} hilos escritores, {args.records} registros, fsync por lote")
+    for max_batch in (1, 8, 64, 512, 4096):
+        rate, p99, scan = run(max_batch, args.threads, args.records)
+        print(f"[BENCH] lote máx={max_batch:<5} {rate:10.0f} reg/s  p99 commit={p99 * 1e3:7.2f} ms  agregado mmap={scan * 1e3:6.2f} ms")
+
+if __name__ == "__main__":
+    main()
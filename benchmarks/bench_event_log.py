@@ -0,0 +1,63 @@
+# Benchmark: costo por llamada de print() vs EventLog (deshabilitado, texto, JSON lines)
+# Uso: python benchmarks/bench_event_log.py [--calls 200000]
+# "llamador" es lo que paga el método caliente; "drenaje" es el formateo + escritura
+# por lotes que hace el hilo de fondo (aquí se mide aparte, con el hilo en espera).
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.event_log import EventLog, INFO
+
+MESSAGE = "[QVE] Absorbiendo {debt_amount} de ineficiencia en {country_id}..."
+
+def bench_print(sink, calls):
+    start = time.perf_counter()
+    for i in range(calls):
+        print(f"[QVE] Absorbiendo {i} de ineficiencia en CHL...", file=sink)
+    return time.perf_counter() - start, 0.0
+
+def bench_events(sink, calls, level, fmt):
+    # Capacidad holgada e intervalo largo: el hilo no despierta hasta close()
+    events = EventLog(level=level, fmt=fmt, stream=sink, capacity=4 * calls, flush_interval=3600)
+    start = time.perf_counter()
+    for i in range(calls):
+        events.info("qve.market", MESSAGE, debt_amount=i, country_id="CHL")
+    caller = time.perf_counter() - start
+    start = time.perf_counter()
+    events.close()
+    return caller, time.perf_counter() - start
+
+def run_cases(label, sink, calls):
+    cases = (
+        ("print (line-buffered)", lambda: bench_print(sink, calls)),
+        ("eventos deshabilitados", lambda: bench_events(sink, calls, "OFF", "text")),
+        ("eventos texto", lambda: bench_events(sink, calls, INFO, "text")),
+        ("eventos JSON lines", lambda: bench_events(sink, calls, INFO, "json")),
+    )
+    print(f"[BENCH] destino: {label}")
+    for name, run in cases:
+        caller, drain = run()
+        print(f"[BENCH]   {name:<24} llamador {caller / calls * 1e9:8.0f} ns/llamada"
+              f"  drenaje {drain / calls * 1e9:8.0f} ns/evento")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+    print(f"[BENCH] {args.calls:,} llamadas por caso")
+
+    # Destinos con buffer de línea, como una terminal: print() hace un write por llamada
+    with open(os.devnull, "w", buffering=1) as sink:
+        run_cases("/dev/null", sink, args.calls)
+    reader = subprocess.Popen([sys.executable, "-c", "import sys; sys.stdin.buffer.read()"], stdin=subprocess.PIPE)
+    with open(reader.stdin.fileno(), "w", buffering=1, closefd=False) as sink:
+        run_cases("pipe a otro proceso", sink, args.calls)
+    reader.stdin.close()
+    reader.wait()
+
+if __name__ == "__main__":
+    main()
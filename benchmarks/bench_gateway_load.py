@@ -0,0 +1,77 @@
+# Generador de carga local para GatewayServer: solicitudes/s y latencia de cola
+# Uso: python benchmarks/bench_gateway_load.py [--connections 10000] [--requests 20] [--pipeline 4]
+# Para 10k conexiones el límite de descriptores debe permitirlo (se intenta subir el soft limit).
+import argparse
+import asyncio
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from core.gateway_server import GatewayServer
+
+MASTER_KEY = "8903037M2903035CHL170519349720268"
+
+def raise_fd_limit(needed):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = hard if hard != resource.RLIM_INFINITY else needed
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(target, max(needed, soft)), hard))
+    return resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+
+async def client(port, requests, pipeline, latencies, statuses, gate):
+    # El semáforo cubre solo el connect: limita los handshakes simultáneos, no las conexiones abiertas
+    async with gate:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    request = (
+        "GET /v1/gateway HTTP/1.1\r\nHost: qve\r\n"
+        f"Authorization: Bearer {MASTER_KEY}\r\n\r\n"
+    ).encode()
+    sent = 0
+    try:
+        while sent < requests:
+            burst = min(pipeline, requests - sent)
+            start = time.perf_counter()
+            writer.write(request * burst)  # pipelining: varias solicitudes sin esperar respuesta
+            await writer.drain()
+            for _ in range(burst):
+                head = await reader.readuntil(b"\r\n\r\n")
+                status = int(head.split(b" ", 2)[1])
+                length = int(head.lower().split(b"content-length: ")[1].split(b"\r\n")[0])
+                await reader.readexactly(length)
+                statuses[status] = statuses.get(status, 0) + 1
+                latencies.append(time.perf_counter() - start)
+            sent += burst
+    finally:
+        writer.close()
+
+async def main(args):
+    server = await GatewayServer(port=0, rate_limit=None, max_inflight=args.connections * 2).start()
+    latencies, statuses = [], {}
+    gate = asyncio.Semaphore(1024)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client(server.port, args.requests, args.pipeline, latencies, statuses, gate)
+                                     for _ in range(args.connections)), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    await server.close()
+    errors = sum(isinstance(result, Exception) for result in results)
+    lat = np.array(latencies) * 1e3
+    print(f"[BENCH] conexiones={args.connections} solicitudes/conexión={args.requests} pipeline={args.pipeline}")
+    print(f"[BENCH] {len(lat) / elapsed:10.0f} req/s  errores de conexión={errors}  estados={statuses}")
+    if len(lat):
+        print(f"[BENCH] latencia ms p50={np.percentile(lat, 50):.2f} p99={np.percentile(lat, 99):.2f} p99.9={np.percentile(lat, 99.9):.2f} max={lat.max():.2f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--pipeline", type=int, default=4)
+    args = parser.parse_args()
+    limit = raise_fd_limit(args.connections * 2 + 64)
+    if limit < args.connections * 2 + 64:
+        print(f"[BENCH] Aviso: límite de descriptores {limit}; reduciendo conexiones")
+        args.connections = (limit - 64) // 2
+    asyncio.run(main(args))
@@ -0,0 +1,53 @@
+# Benchmark: IdentityGuard.verify_many a 1/4/16 hilos (sin caché) y verify_authority con/sin caché
+# Uso: python benchmarks/bench_identity_guard.py [--keys 20000] [--key-bytes 4096]
+import argparse
+import hashlib
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from security.master_vault.master_validator import IdentityGuard
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=20000)
+    parser.add_argument("--key-bytes", type=int, default=4096)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    keys = [os.urandom(args.key_bytes // 2).hex() for _ in range(args.keys)]
+    mb = args.keys * args.key_bytes / 1e6
+    print(f"[BENCH] {args.keys} llaves de {args.key_bytes} bytes")
+    for workers in (1, 4, 16):
+        guard = IdentityGuard(cache_size=0)
+        latencies = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            guard.verify_many(keys, workers=workers)
+            latencies.append(time.perf_counter() - start)
+        best = min(latencies)
+        print(f"[BENCH] hilos={workers:<3} {args.keys / best / 1e3:9.1f} K llaves/s  {mb / best:8.1f} MB/s"
+              f"  lote p50={statistics.median(latencies) * 1e3:7.2f} ms  max={max(latencies) * 1e3:7.2f} ms")
+
+    # Costo por llamada: sin caché, acierto de caché y fallo de caché (llave inválida, nunca se cachea)
+    master_hash = hashlib.sha256(keys[0].encode()).hexdigest()
+    plain = IdentityGuard(master_hash=master_hash)
+    cached = IdentityGuard(cache_size=4096, master_hash=master_hash)
+    cached.verify_authority(keys[0])
+    calls = 20_000
+    costs = {}
+    for label, guard, key in (("sin caché", plain, keys[0]), ("caché acierto", cached, keys[0]),
+                              ("caché fallo", cached, keys[1])):
+        start = time.perf_counter()
+        for _ in range(calls):
+            guard.verify_authority(key)
+        costs[label] = (time.perf_counter() - start) / calls
+    base = costs["sin caché"]
+    for label, cost in costs.items():
+        print(f"[BENCH] {label:<14} {cost * 1e6:8.2f} us/llamada  ({cost / base:.2f}x sin caché)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Benchmark: arranque en frío por punto de entrada (import en un intérprete nuevo)
+# Uso: python benchmarks/bench_import_time.py [--runs 5] [--baseline imports.json] [--save-baseline imports.json]
+# Cada medición corre en un subproceso con -X importtime; se reporta el tiempo de
+# import (suma de "self" de todos los módulos), el total de pared descontando el
+# intérprete vacío, los módulos más pesados y si NumPy quedó cargado.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from suite import compare
+
+def _import_file(path):
+    return (
+        "import importlib.util, sys; "
+        f"spec = importlib.util.spec_from_file_location('entry', {path!r}); "
+        "module = importlib.util.module_from_spec(spec); sys.modules['entry'] = module; spec.loader.exec_module(module)"
+    )
+
+# nombre -> código que ejecuta el intérprete nuevo (solo cargar, sin correr la activación)
+ENTRY_POINTS = {
+    "start_miax": "import runpy; runpy.run_path('start_miax.py')",
+    "core.miax_absorber": "import core.miax_absorber",
+    "BTC_Layer_3_(L3)": _import_file("BTC_Layer_3_(L3).py"),
+    "QVE_INFRA_ACTIVATE": "import QVE_INFRA_ACTIVATE",
+    "QVE_ORCHESTRATOR": "import QVE_ORCHESTRATOR",
+    "QVE_INTEGRATE": "import QVE_INTEGRATE",
+    "QVE_OMNI_MASTER_V1": "import QVE_OMNI_MASTER_V1",
+    "CORE_SOVEREIGN_ACTIVATE": "import CORE_SOVEREIGN_ACTIVATE",
+    "MIAX_AutoDeploy": "import MIAX_AutoDeploy",
+    "QVE_DEPLOY_PLAN": "import QVE_DEPLOY_PLAN",
+    "agents.mia_x_brain.orchestrator": "import agents.mia_x_brain.orchestrator",
+    "agents.mia_x.healing_system": "import agents.mia_x.healing_system",
+    "security.master_vault.master_validator": "import security.master_vault.master_validator",
+    "core.gateway_server": "import core.gateway_server",
+    "core.conversion_ledger": "import core.conversion_ledger",
+}
+
+def measure(code):
+    """Un arranque en frío: (ms de import, ms de pared, [(ms acumulados, módulo, profundidad)], numpy cargado)."""
+    probe = code + "; import sys; sys.stderr.write('numpy-loaded=%d\\n' % ('numpy.linalg' in sys.modules))"
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", probe], cwd=ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    wall = (time.perf_counter() - start) * 1e3
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    self_us = 0
+    modules = []
+    numpy_loaded = False
+    for line in result.stderr.splitlines():
+        if line.startswith("numpy-loaded="):
+            numpy_loaded = line.endswith("1")
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        self_us += int(own)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((int(cumulative) / 1e3, name.strip(), depth))
+    return self_us / 1e3, wall, sorted(modules, reverse=True), numpy_loaded
+
+def heaviest(modules, skip, count):
+    # Dependencias directas del punto de entrada (profundidad <= 1), sin los módulos del arranque del intérprete
+    picked = [(ms, name) for ms, name, depth in modules if depth <= 1 and name not in skip]
+    return ", ".join(f"{name} {ms:.1f}" for ms, name in picked[:count])
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--filter")
+    parser.add_argument("--top", type=int, default=3, help="módulos más pesados a mostrar por entrada")
+    parser.add_argument("--baseline")
+    parser.add_argument("--save-baseline")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    empty_runs = [measure("pass") for _ in range(args.runs)]
+    empty = statistics.median(run[1] for run in empty_runs)
+    startup = {name for _, name, _ in empty_runs[0][2]} | {"entry", "runpy", "pkgutil", "importlib.util"}
+    print(f"[BENCH] intérprete vacío: {empty:.1f} ms de pared (se descuenta)")
+    print(f"{'entrada':<42}{'import ms':>11}{'pared ms':>11}  numpy  más pesados")
+    results = {}
+    for name, code in ENTRY_POINTS.items():
+        if args.filter and args.filter not in name:
+            continue
+        runs = [measure(code) for _ in range(args.runs)]
+        import_ms = statistics.median(run[0] for run in runs)
+        wall_ms = statistics.median(run[1] for run in runs) - empty
+        top = heaviest(runs[-1][2], startup | {name}, args.top)
+        print(f"{name:<42}{import_ms:>11.1f}{wall_ms:>11.1f}  {'sí' if runs[-1][3] else 'no':<5}  {top}")
+        results[name] = {"median_s": import_ms / 1e3, "min_s": min(run[0] for run in runs) / 1e3, "runs": args.runs}
+
+    current = {"size": "import", "python": sys.version.split()[0], "results": results}
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+        print(f"\n[BENCH] Línea base guardada en {args.save_baseline}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(current, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n[FALLO] {len(regressions)} regresión(es) de arranque sobre el umbral de {args.threshold:.0%}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
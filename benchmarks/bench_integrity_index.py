@@ -0,0 +1,48 @@
+# Benchmark: IntegrityIndex, pasada inicial vs pasada sin cambios sobre un árbol sintético
+# Uso: python benchmarks/bench_integrity_index.py [--files 100000]
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.mia_x.healing_system import IntegrityIndex, heal_system
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--per-dir", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        for i in range(args.files):
+            directory = os.path.join(root, f"layer_{i // args.per_dir:04d}")
+            if i % args.per_dir == 0:
+                os.makedirs(directory)
+            with open(os.path.join(directory, f"segment_{i}.py"), "w") as f:
+                f.write(f"SEGMENT = {i}\n")
+        templates = {"layer_0000/segment_0.py": "SEGMENT = 0\n"}
+
+        start = time.perf_counter()
+        IntegrityIndex(root).refresh()
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        report = heal_system(root, templates=templates)
+        warm = time.perf_counter() - start
+
+        with open(os.path.join(root, "layer_0000", "segment_0.py"), "w") as f:
+            f.write("CORRUPTO\n")
+        start = time.perf_counter()
+        repaired = heal_system(root, templates=templates)
+        repair = time.perf_counter() - start
+
+        print(f"[BENCH] {args.files} archivos")
+        print(f"[BENCH] índice inicial (hash completo): {cold:7.3f} s")
+        print(f"[BENCH] sanación sin cambios:           {warm:7.3f} s  {report}")
+        print(f"[BENCH] sanación con 1 archivo corrupto: {repair:7.3f} s  restaurados={repaired['restored']}")
+
+if __name__ == "__main__":
+    main()
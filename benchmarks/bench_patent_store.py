@@ -0,0 +1,60 @@
+# Benchmark: PatentStore, importación masiva y consultas (acierto, fallo, prefijo)
+# Uso: python benchmarks/bench_patent_store.py [--names 10000000]
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from legal.galactic_ip_vault.patent_store import PatentStore
+
+def rate(count, seconds):
+    return f"{count / seconds:,.0f}/s"
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--names", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    names = [f"Artemis_Tech_{i:09d}" for i in range(args.names)]
+    store = PatentStore()
+    start = time.perf_counter()
+    store.bulk_import(names)
+    elapsed = time.perf_counter() - start
+    print(f"bulk_import   {args.names:>12,} nombres  {elapsed:8.2f}s  {rate(args.names, elapsed)}")
+
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "patents.qvp")
+        start = time.perf_counter()
+        store.save(path)
+        print(f"save          {time.perf_counter() - start:8.2f}s  {os.path.getsize(path) / 1e6:,.1f} MB")
+        start = time.perf_counter()
+        store = PatentStore(path)
+        print(f"open (mmap)   {(time.perf_counter() - start) * 1e3:8.2f}ms")
+
+        step = max(1, args.names // args.queries)
+        hits = names[::step][:args.queries]
+        misses = [f"Lunar_Tech_{i:09d}" for i in range(len(hits))]
+        for label, queries in (("lookup hit", hits), ("lookup miss", misses)):
+            start = time.perf_counter()
+            found = sum(name in store for name in queries)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<13} {len(queries):>12,} consultas {rate(len(queries), elapsed):>14}  encontrados={found:,}")
+
+        prefixes = [name[:-3] for name in hits[:10_000]]
+        start = time.perf_counter()
+        total = sum(len(store.prefix_search(prefix)) for prefix in prefixes)
+        elapsed = time.perf_counter() - start
+        print(f"prefix_search {len(prefixes):>12,} consultas {rate(len(prefixes), elapsed):>14}  resultados={total:,}")
+
+        start = time.perf_counter()
+        added = sum(store.add(f"Orbital_Tech_{i}") for i in range(10_000))
+        elapsed = time.perf_counter() - start
+        print(f"add           {added:>12,} altas     {rate(added, elapsed):>14}")
+        del store
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# Benchmark: TileRenderScheduler, cuadros/s y memoria pico en 4K/8K/16K
+# Cuadros: en frío, un elemento movido (parcial), sin cambios, y de vuelta al primero (caché de tiles)
+# Uso: python benchmarks/bench_render_scheduler.py [--resolutions 4K 8K 16K] [--workers N]
+import argparse
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.render_scheduler import TileRenderScheduler, Scene
+
+def peak_rss_mb():
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return (own + children) / 1024
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resolutions", nargs="+", default=["4K", "8K", "16K"])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--tile", type=int, default=512)
+    args = parser.parse_args()
+
+    for name in args.resolutions:
+        with TileRenderScheduler.for_resolution(name, tile_size=args.tile, workers=args.workers, cache_bytes=1 << 30) as scheduler:
+            elements = [(200 * i, 150 * i, 300, 200, (255, 0, 32 * i)) for i in range(8)]
+            frames = [
+                Scene("EON_Studios", elements),
+                Scene("EON_Studios", elements[:-1] + [(1000, 900, 300, 200, (0, 255, 0))]),
+                Scene("EON_Studios", elements[:-1] + [(1000, 900, 300, 200, (0, 255, 0))]),
+                Scene("EON_Studios", elements),
+            ]
+            timings = []
+            for scene in frames:
+                start = time.perf_counter()
+                scheduler.render(scene)
+                timings.append(time.perf_counter() - start)
+            fps = ", ".join(f"{1 / t:7.2f}" for t in timings)
+            print(f"[BENCH] {name:<4} fps (frío, parcial, igual, caché): {fps}  tiles={scheduler.stats}  RSS pico ~{peak_rss_mb():.0f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# Benchmark: ValuationEngine, caminos/s escalando de 1 a N procesos
+# Uso: python benchmarks/bench_valuation_engine.py [--paths 4000000] [--max-workers N]
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.valuation_engine import ValuationEngine
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paths", type=int, default=4_000_000)
+    parser.add_argument("--shard-size", type=int, default=250_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    engine = ValuationEngine()
+    workers = 1
+    baseline = None
+    while workers <= args.max_workers:
+        start = time.perf_counter()
+        report = engine.run(paths=args.paths, shard_size=args.shard_size, workers=workers)
+        rate = args.paths / (time.perf_counter() - start)
+        baseline = baseline or rate
+        median = report["total"]["quantiles"][0.5]
+        print(f"[BENCH] procesos={workers:<3} {rate / 1e6:7.2f} M caminos/s  x{rate / baseline:5.2f}  mediana=${median / 1e12:.4f}T")
+        workers *= 2
+
+if __name__ == "__main__":
+    main()
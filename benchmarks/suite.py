@@ -0,0 +1,243 @@
+# Suite de benchmarks de rutas calientes con comparación contra una línea base JSON
+# Uso:
+#   python benchmarks/suite.py --size small --save-baseline benchmarks/baseline-small.json
+#   python benchmarks/suite.py --size small --baseline benchmarks/baseline-small.json [--threshold 0.25]
+# Sale con código 1 si algún caso es más lento que la línea base por encima del umbral.
+# Cada muestra repite la operación hasta durar al menos MIN_SAMPLE_S. Un caso solo
+# es regresión si hasta su mejor muestra (mínimo por llamada) supera la mediana de la
+# línea base por encima del umbral: el ruido del sistema solo hace más lentas algunas
+# muestras, no todas. La línea base de CI se guarda con --size medium en la misma
+# clase de máquina que corre la comparación.
+# Los scripts bench_*.py siguen siendo los estudios detallados de cada componente.
+import argparse
+import functools
+import hashlib
+import importlib.util
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from core.event_log import get_event_log
+from core.timing import get_registry
+
+SIZES = {
+    "small": {"ticks": 200_000, "keys": 2_000, "key_bytes": 1024, "records": 20_000, "blob_mb": 8, "files": 200},
+    "medium": {"ticks": 2_000_000, "keys": 20_000, "key_bytes": 1024, "records": 200_000, "blob_mb": 64, "files": 2_000},
+    "large": {"ticks": 20_000_000, "keys": 200_000, "key_bytes": 1024, "records": 2_000_000, "blob_mb": 512, "files": 20_000},
+}
+BENCHMARKS = {}
+MIN_SAMPLE_S = 0.05
+
+def benchmark(name):
+    """Registra un caso: la función prepara los datos y devuelve la operación a cronometrar."""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+# --- Generadores sintéticos (deterministas por semilla) ---
+def gen_ticks(count, seed=1618):
+    # Camino aleatorio alrededor del umbral BTC para ejercitar ambas señales
+    rng = np.random.default_rng(seed)
+    return 100_000.0 + np.cumsum(rng.normal(0.0, 250.0, count))
+
+def gen_keys(count, key_bytes, seed=7):
+    rng = np.random.default_rng(seed)
+    return [rng.bytes(key_bytes // 2).hex() for _ in range(count)]
+
+def gen_life_records(count, duplicate_fraction=0.1, seed=3):
+    rng = np.random.default_rng(seed)
+    unique = int(count * (1 - duplicate_fraction)) or 1
+    return [f"life-form-{i}" for i in rng.integers(0, unique, count)]
+
+def gen_blob_file(directory, megabytes, seed=11):
+    path = os.path.join(directory, "industry.bin")
+    rng = np.random.default_rng(seed)
+    with open(path, "wb") as f:
+        for _ in range(megabytes):
+            f.write(rng.bytes(1 << 20))
+    return path
+
+def gen_deploy_files(directory, count, size=2048):
+    body = "# segmento generado\n" + "x = 1\n" * (size // 6)
+    return {os.path.join(directory, f"layer_{i // 100:03d}", f"segment_{i}.py"): body + f"SEGMENT = {i}\n" for i in range(count)}
+
+@functools.lru_cache(maxsize=None)
+def load_btc_layer():
+    spec = importlib.util.spec_from_file_location("btc_layer_3", os.path.join(ROOT, "BTC_Layer_3_(L3).py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# --- Casos ---
+@benchmark("absorber.open_black_hole")
+def bench_open_black_hole(size, scratch):
+    from core.miax_absorber import MIAX_Absorber
+    engine, ticks = MIAX_Absorber(), gen_ticks(size["ticks"])
+    return lambda: engine.open_black_hole(ticks)
+
+@benchmark("absorber.open_black_hole_stream")
+def bench_open_black_hole_stream(size, scratch):
+    from core.miax_absorber import MIAX_Absorber
+    path = os.path.join(scratch, "ticks.f64")
+    gen_ticks(size["ticks"]).tofile(path)
+    engine = MIAX_Absorber()
+    return lambda: engine.open_black_hole_stream(path, chunk_size=1 << 18)
+
+@benchmark("absorber.btc_pull_signals.rolling_mean")
+def bench_btc_pull_signals(size, scratch):
+    from core.miax_absorber import MIAX_Absorber
+    engine, ticks = MIAX_Absorber(), gen_ticks(size["ticks"])
+    return lambda: engine.btc_pull_signals(ticks, mode="rolling_mean", window=50)
+
+@benchmark("identity_guard.verify_many")
+def bench_verify_many(size, scratch):
+    from security.master_vault.master_validator import IdentityGuard
+    guard, keys = IdentityGuard(cache_size=0), gen_keys(size["keys"], size["key_bytes"])
+    return lambda: guard.verify_many(keys, workers=4)
+
+@benchmark("identity_guard.verify_authority.cached")
+def bench_verify_cached(size, scratch):
+    from security.master_vault.master_validator import IdentityGuard
+    # Solo se cachean aciertos: se verifica repetidamente una llave válida
+    key = gen_keys(1, size["key_bytes"])[0]
+    guard = IdentityGuard(cache_size=4096, master_hash=hashlib.sha256(key.encode()).hexdigest())
+    keys = [key] * 1024
+    guard.verify_authority(key)
+    return lambda: [guard.verify_authority(key) for key in keys]
+
+@benchmark("life_mapper.tokenize_bulk")
+def bench_tokenize_bulk(size, scratch):
+    mapper, records = load_btc_layer().Universal_Life_Mapper(), gen_life_records(size["records"])
+    # Un solo proceso: mide el costo por registro sin el ruido del pool
+    return lambda: mapper.tokenize_bulk(records, workers=1)
+
+@benchmark("expansion_engine.absorb_industry_dominion")
+def bench_absorb_dominion(size, scratch):
+    from pathlib import Path
+    engine = load_btc_layer().Sovereign_Expansion_Engine("BENCH")
+    path = Path(gen_blob_file(scratch, size["blob_mb"]))
+    return lambda: engine.absorb_industry_dominion(path, digest="blake2b")
+
+@benchmark("deploy.deploy_files.unchanged")
+def bench_deploy_unchanged(size, scratch):
+    from core.deploy_manifest import DeployManifest, deploy_files
+    files = gen_deploy_files(os.path.join(scratch, "deploy"), size["files"])
+    manifest = DeployManifest(os.path.join(scratch, "manifest.json"))
+    deploy_files(files, manifest=manifest)
+    return lambda: deploy_files(files, manifest=manifest)
+
+@benchmark("deploy.deploy_files.cold")
+def bench_deploy_cold(size, scratch):
+    from core.deploy_manifest import DeployManifest, deploy_files
+    runs = iter(range(1 << 30))
+
+    def deploy():
+        # Cada corrida despliega en un directorio y manifiesto nuevos
+        target = os.path.join(scratch, f"cold_{next(runs)}")
+        deploy_files(gen_deploy_files(target, size["files"]), manifest=DeployManifest(target + ".json"))
+    return deploy
+
+# --- Ejecución y comparación ---
+def calibrate(operation):
+    """Llamadas por muestra para que cada una dure al menos MIN_SAMPLE_S (como timeit.autorange)."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SAMPLE_S:
+            return loops
+        loops = max(loops * 2, math.ceil(loops * MIN_SAMPLE_S / max(elapsed, 1e-9)))
+
+def run_suite(size_name, repeat, pattern=None):
+    size = SIZES[size_name]
+    registry = get_registry().enable()
+    registry.reset()
+    # Se mide el trabajo, no la terminal: los eventos de las rutas calientes se descartan
+    get_event_log().configure(level="OFF")
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        with tempfile.TemporaryDirectory() as scratch:
+            operation = setup(size, scratch)
+            operation()  # calentamiento: cachés de disco, imports, pools
+            loops = calibrate(operation)
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for _ in range(loops):
+                    operation()
+                samples.append((time.perf_counter() - start) / loops)
+        results[name] = {"median_s": statistics.median(samples), "min_s": min(samples), "runs": repeat, "loops": loops}
+        print(f"[BENCH] {name:<46} mediana {results[name]['median_s'] * 1e3:10.3f} ms  mín {min(samples) * 1e3:10.3f} ms  ({loops} llamadas/muestra)")
+    return {
+        "size": size_name,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+        "timings": registry.snapshot(),
+    }
+
+def compare(current, baseline, threshold):
+    """Devuelve la lista de regresiones (nombre, mínimo actual / mediana base) por encima de 1 + threshold."""
+    if baseline.get("size") != current["size"]:
+        print(f"[AVISO] La línea base es de tamaño {baseline.get('size')!r}, la corrida es {current['size']!r}")
+    regressions = []
+    print(f"\n{'caso':<46}{'base med ms':>12}{'actual mín':>12}{'ratio':>9}")
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print(f"{name:<46}{'-':>12}{result['min_s'] * 1e3:>12.3f}{'nuevo':>9}")
+            continue
+        ratio = result["min_s"] / base["median_s"] if base["median_s"] else float("inf")
+        flag = "  << REGRESIÓN" if ratio > 1 + threshold else ""
+        print(f"{name:<46}{base['median_s'] * 1e3:>12.3f}{result['min_s'] * 1e3:>12.3f}{ratio:>9.2f}{flag}")
+        if flag:
+            regressions.append((name, ratio))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks QVE")
+    parser.add_argument("--size", choices=SIZES, default="small")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", help="solo los casos cuyo nombre contiene este texto")
+    parser.add_argument("--baseline", help="JSON de línea base contra el cual comparar")
+    parser.add_argument("--save-baseline", help="guarda esta corrida como línea base")
+    parser.add_argument("--threshold", type=float, default=0.25, help="regresión tolerada (0.25 = 25%% más lento)")
+    parser.add_argument("--list", action="store_true")
+    args = parser.parse_args()
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    current = run_suite(args.size, args.repeat, args.filter)
+    print("\n" + get_registry().report())
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+        print(f"\n[BENCH] Línea base guardada en {args.save_baseline}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n[FALLO] {len(regressions)} regresión(es) sobre el umbral de {args.threshold:.0%}")
+            return 1
+        print(f"\n[OK] Sin regresiones sobre el umbral de {args.threshold:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
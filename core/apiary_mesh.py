@@ -0,0 +1,472 @@
+import os
+import sys
+import time
+import socket
+import struct
+import argparse
+import subprocess
+import threading
+from collections import deque
+
+from core.event_log import get_event_log
+from core.lazy import lazy_import
+from core.miax_absorber import (
+    BTC_THRESHOLD, DEFAULT_CHUNK_ELEMENTS, GOLDEN_RATIO, ROLLING_BLOCK, SIGNAL_BUY_SUPPORT,
+    SIGNAL_CONSOLIDATE, SIGNAL_MODES, hysteresis_codes, kahan_sum, rolling_mean_range,
+)
+
+np = lazy_import("numpy")
+
+# --- APIARY MESH: absorción repartida entre nodos (coordinador / workers) ---
+# mia-x-central coordina; los workers (nodo-latam-sync u otros procesos locales)
+# se conectan por TCP y reciben shards. Cada trama es una cabecera fija + el array
+# crudo en little-endian (sin pickle): el worker lo recibe directo en un buffer
+# NumPy con recv_into. Los shards se alinean a los bloques del cálculo local, así
+# que el resultado combinado es bit a bit el de una sola máquina. Si un worker se
+# cae (o excede task_timeout) su shard vuelve a la cola y lo toma otro.
+
+DEFAULT_PORT = 7070
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MAGIC = b"QVAM"
+# magia, op, dtype del payload, modo, flags, tarea, inicio, largo, halo, parámetro, elementos del payload, banda
+FRAME = struct.Struct("<4sBBBBIQQQQQd")
+
+OP_HELLO = 1      # worker -> coordinador (param = pid)
+OP_SUM = 2        # array del shard; param = chunk_size -> parciales float64 por bloque
+OP_SUM_FILE = 3   # ruta UTF-8 en disco compartido; modo = dtype del archivo; [inicio, inicio+largo)
+OP_SIGNALS = 4    # precios float64 (halo + largo); modo = índice en SIGNAL_MODES; param = window
+OP_RESULT = 5
+OP_ERROR = 6      # mensaje UTF-8
+OP_SHUTDOWN = 7
+
+DT_BYTES, DT_F64, DT_I8, DT_F32 = 0, 1, 2, 3
+DTYPES = {DT_BYTES: "|u1", DT_F64: "<f8", DT_I8: "|i1", DT_F32: "<f4"}
+DTYPE_CODES = {name: code for code, name in DTYPES.items()}
+
+class MeshError(RuntimeError):
+    """Error reportado por un worker al procesar un shard (no se reintenta)."""
+
+class Frame:
+    __slots__ = ("op", "dtype", "mode", "task", "start", "length", "halo", "param", "band", "payload")
+
+    def __init__(self, op, dtype, mode, task, start, length, halo, param, band, payload):
+        self.op = op
+        self.dtype = dtype
+        self.mode = mode
+        self.task = task
+        self.start = start
+        self.length = length
+        self.halo = halo
+        self.param = param
+        self.band = band
+        self.payload = payload
+
+def _dtype_code(dtype):
+    code = DTYPE_CODES.get(np.dtype(dtype).str)
+    if code is None:
+        raise TypeError(f"dtype no soportado por la malla: {dtype}")
+    return code
+
+def send_frame(sock, op, payload=b"", task=0, start=0, length=0, halo=0, param=0, mode=0, band=0.0):
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        dtype, count, data = DT_BYTES, len(payload), payload
+    else:
+        payload = np.ascontiguousarray(payload)
+        dtype, count, data = _dtype_code(payload.dtype), payload.size, payload.view(np.uint8).reshape(-1)
+    sock.sendall(FRAME.pack(MAGIC, op, dtype, mode, 0, task, start, length, halo, param, count, band))
+    if count:
+        sock.sendall(data)
+
+def recv_frame(sock):
+    """Lee una trama completa; devuelve None si el otro extremo cerró entre tramas."""
+    header = bytearray(FRAME.size)
+    if not _recv_into(sock, memoryview(header), eof_ok=True):
+        return None
+    magic, op, dtype, mode, _, task, start, length, halo, param, count, band = FRAME.unpack(header)
+    if magic != MAGIC or dtype not in DTYPES:
+        raise ConnectionError("Trama inválida en la malla")
+    if dtype == DT_BYTES:
+        payload = bytearray(count)
+        view = memoryview(payload)
+    else:
+        payload = np.empty(count, dtype=DTYPES[dtype])
+        view = memoryview(payload.view(np.uint8).reshape(-1))
+    if count:
+        _recv_into(sock, view)
+    return Frame(op, dtype, mode, task, start, length, halo, param, band, payload)
+
+def _recv_into(sock, view, eof_ok=False):
+    received = 0
+    while received < len(view):
+        size = sock.recv_into(view[received:])
+        if not size:
+            if eof_ok and received == 0:
+                return False
+            raise ConnectionError("Conexión cerrada a mitad de trama")
+        received += size
+    return True
+
+# --- Worker ---
+def chunk_partials(values, chunk_size):
+    # Igual que open_black_hole_stream: un np.sum (pairwise) por bloque de chunk_size
+    return np.array([np.sum(values[i:i + chunk_size], dtype=np.float64) for i in range(0, len(values), chunk_size)],
+                    dtype=np.float64)
+
+def handle_frame(frame):
+    """Calcula el resultado de un shard; función pura para poder probarla sin sockets."""
+    if frame.op == OP_SUM:
+        return chunk_partials(frame.payload, frame.param)
+    if frame.op == OP_SUM_FILE:
+        dtype = np.dtype(DTYPES[frame.mode])
+        ticks = np.memmap(bytes(frame.payload).decode("utf-8"), dtype=dtype, mode="r",
+                          offset=frame.start * dtype.itemsize, shape=(frame.length,))
+        return chunk_partials(ticks, frame.param)
+    if frame.op == OP_SIGNALS:
+        prices = frame.payload
+        mode = SIGNAL_MODES[frame.mode]
+        if mode == "fixed":
+            return (~(prices[frame.halo:] < BTC_THRESHOLD)).astype(np.int8)
+        if mode == "rolling_mean":
+            means = rolling_mean_range(prices, frame.param, frame.start, frame.start + frame.length,
+                                       base=frame.start - frame.halo)
+            return (means >= BTC_THRESHOLD).astype(np.int8)
+        return hysteresis_codes(prices[frame.halo:], BTC_THRESHOLD * (1 - frame.band), BTC_THRESHOLD * (1 + frame.band))
+    raise ValueError(f"Operación desconocida: {frame.op}")
+
+def connect(host, port, retry=30.0):
+    # El coordinador puede arrancar después (docker-compose): se reintenta hasta `retry` segundos
+    deadline = time.monotonic() + retry
+    while True:
+        try:
+            sock = socket.create_connection((host, port))
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.2)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+def serve_worker(host, port, retry=30.0):
+    """Ciclo de un worker: atiende shards hasta que el coordinador cierre o envíe OP_SHUTDOWN."""
+    sock = connect(host, port, retry)
+    with sock:
+        send_frame(sock, OP_HELLO, param=os.getpid())
+        while True:
+            frame = recv_frame(sock)
+            if frame is None or frame.op == OP_SHUTDOWN:
+                return
+            try:
+                result = handle_frame(frame)
+            except Exception as e:
+                send_frame(sock, OP_ERROR, f"{type(e).__name__}: {e}".encode("utf-8"), task=frame.task)
+                continue
+            send_frame(sock, OP_RESULT, result, task=frame.task)
+
+# --- Coordinador ---
+class MeshWorker:
+    def __init__(self, sock, address, pid):
+        self.sock = sock
+        self.address = address
+        self.pid = pid
+        self.alive = True
+        self.busy = False
+        self.completed = 0
+
+class _Job:
+    def __init__(self, count):
+        self.pending = deque(range(count))
+        self.results = [None] * count
+        self.remaining = count
+        self.reassigned = 0
+        self.error = None
+        self.cond = threading.Condition()
+
+class ApiaryMesh:
+    """Coordinador de la malla: acepta workers y reparte shards de absorción y señales."""
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, shards_per_worker=4, task_timeout=None, worker_timeout=30.0):
+        self.host = host
+        self.port = port
+        self.shards_per_worker = shards_per_worker
+        self.task_timeout = task_timeout
+        self.worker_timeout = worker_timeout
+        self.events = get_event_log()
+        self._server = None
+        self._workers = []
+        self._lock = threading.Lock()
+        self._joined = threading.Condition(self._lock)
+        self._job_lock = threading.Lock()
+        self._processes = []
+        self._closing = False
+
+    # --- Ciclo de vida ---
+    def start(self):
+        self._server = socket.create_server((self.host, self.port), backlog=128)
+        self.port = self._server.getsockname()[1]
+        threading.Thread(target=self._accept_loop, name="qve-mesh-accept", daemon=True).start()
+        return self
+
+    def spawn_local(self, count):
+        """Lanza `count` workers en procesos locales conectados a este coordinador."""
+        host = "127.0.0.1" if self.host in ("", "0.0.0.0") else self.host
+        for _ in range(count):
+            self._processes.append(subprocess.Popen(
+                [sys.executable, "-m", "core.apiary_mesh", "worker", "--connect", f"{host}:{self.port}"], cwd=ROOT))
+        return self
+
+    def wait_for_workers(self, count, timeout=None):
+        timeout = self.worker_timeout if timeout is None else timeout
+        with self._joined:
+            if not self._joined.wait_for(lambda: len(self.workers) >= count, timeout):
+                raise TimeoutError(f"Solo {len(self.workers)} de {count} workers se unieron a la malla")
+        return self
+
+    @property
+    def workers(self):
+        return [worker for worker in self._workers if worker.alive]
+
+    def close(self):
+        self._closing = True
+        if self._server is not None:
+            self._server.close()
+        with self._job_lock:
+            for worker in self.workers:
+                try:
+                    send_frame(worker.sock, OP_SHUTDOWN)
+                except OSError:
+                    pass
+                worker.alive = False
+                worker.sock.close()
+        for process in self._processes:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    def __enter__(self):
+        return self if self._server else self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _accept_loop(self):
+        while not self._closing:
+            try:
+                sock, address = self._server.accept()
+            except OSError:
+                return
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.settimeout(5.0)
+                hello = recv_frame(sock)
+                if hello is None or hello.op != OP_HELLO:
+                    raise ConnectionError("Saludo inválido")
+                sock.settimeout(self.task_timeout)
+            except OSError:
+                sock.close()
+                continue
+            with self._joined:
+                self._workers.append(MeshWorker(sock, address, hello.param))
+                self._joined.notify_all()
+
+    # --- Cargas de trabajo ---
+    def open_black_hole(self, source, dtype="float64", chunk_size=DEFAULT_CHUNK_ELEMENTS, shared_fs=True):
+        """Absorción repartida; el resultado es idéntico a open_black_hole_stream(source, dtype, chunk_size).
+
+        `source` es la ruta de un archivo de ticks o un array (equivale a pasarle
+        al stream sus bloques de chunk_size elementos). Con shared_fs=True
+        (mismo host o volumen compartido) los workers mapean su tramo del archivo
+        y solo viaja la ruta; si no, el coordinador envía cada tramo.
+        """
+        shards = []
+        if isinstance(source, (str, os.PathLike)):
+            path = os.path.abspath(source)
+            itemsize = np.dtype(dtype).itemsize
+            total = os.path.getsize(path) // itemsize
+            ticks = None if shared_fs else np.memmap(path, dtype=dtype, mode="r") if total else np.empty(0, dtype)
+            for start, stop in self._plan(total, chunk_size):
+                if shared_fs:
+                    shards.append(dict(op=OP_SUM_FILE, payload=path.encode("utf-8"), start=start, length=stop - start,
+                                       param=chunk_size, mode=_dtype_code(dtype)))
+                else:
+                    shards.append(dict(op=OP_SUM, payload=ticks[start:stop], param=chunk_size))
+        else:
+            values = np.asarray(source)
+            if np.dtype(values.dtype).str not in DTYPE_CODES:
+                values = values.astype(np.float64)
+            for start, stop in self._plan(len(values), chunk_size):
+                shards.append(dict(op=OP_SUM, payload=values[start:stop], param=chunk_size))
+        job = self._run(shards, "absorción")
+        partials = [float(partial) for result in job.results for partial in result]
+        return {
+            "liquidity_generated": kahan_sum(partials) * GOLDEN_RATIO,
+            "status": "STABLE",
+            "partials": partials,
+            "shards": len(shards),
+            "reassigned": job.reassigned,
+        }
+
+    def btc_pull_signals(self, prices, mode="fixed", window=20, band=0.02):
+        """Versión repartida de MIAX_Absorber.btc_pull_signals (mismos códigos int8, bit a bit)."""
+        if mode not in SIGNAL_MODES:
+            raise ValueError(f"Modo de señal desconocido: {mode}")
+        if window < 1:
+            raise ValueError("window debe ser >= 1")
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        shards = []
+        for start, stop in self._plan(len(prices), ROLLING_BLOCK):
+            # La media móvil necesita los `window` precios anteriores al tramo
+            halo = min(start, window) if mode == "rolling_mean" else 0
+            shards.append(dict(op=OP_SIGNALS, payload=prices[start - halo:stop], start=start, length=stop - start,
+                               halo=halo, param=window, mode=SIGNAL_MODES.index(mode), band=band))
+        job = self._run(shards, "señales")
+        if mode == "hysteresis":
+            self._resolve_hysteresis(prices, job.results)
+        return np.concatenate(job.results) if job.results else np.empty(0, dtype=np.int8)
+
+    @staticmethod
+    def _resolve_hysteresis(prices, results):
+        # El tramo inicial dentro de la banda de cada shard hereda la última señal del shard anterior
+        previous = SIGNAL_CONSOLIDATE if len(prices) and prices[0] >= BTC_THRESHOLD else SIGNAL_BUY_SUPPORT
+        for codes in results:
+            if codes.size and codes[0] < 0:
+                codes[codes < 0] = previous
+            if codes.size:
+                previous = codes[-1]
+
+    def _plan(self, total, align):
+        """Tramos [inicio, fin) alineados a `align`, ~shards_per_worker por worker vivo."""
+        if total == 0:
+            return []
+        target = max(1, len(self.workers) or 1) * self.shards_per_worker
+        blocks = -(-total // align)
+        step = -(-blocks // target) * align
+        return [(start, min(start + step, total)) for start in range(0, total, step)]
+
+    # --- Reparto con reasignación ---
+    def _run(self, shards, label):
+        job = _Job(len(shards))
+        with self._job_lock:
+            self.events.info("mesh.coordinator", "[MIA-X] Malla: {shards} shards de {label} en {workers} workers",
+                             shards=len(shards), label=label, workers=len(self.workers))
+            orphaned_since = None
+            while True:
+                with job.cond:
+                    if job.error is not None:
+                        raise job.error
+                    if job.remaining == 0:
+                        return job
+                live = self.workers
+                for worker in live:
+                    if not worker.busy:
+                        worker.busy = True
+                        threading.Thread(target=self._drive, args=(worker, shards, job), daemon=True).start()
+                if live:
+                    orphaned_since = None
+                elif orphaned_since is None:
+                    orphaned_since = time.monotonic()
+                elif time.monotonic() - orphaned_since > self.worker_timeout:
+                    raise RuntimeError(f"No quedan workers en la malla ({job.remaining} shards sin procesar)")
+                with job.cond:
+                    job.cond.wait(0.05)
+
+    def _drive(self, worker, shards, job):
+        try:
+            while True:
+                with job.cond:
+                    # Un worker ocioso espera: un shard de un worker caído puede volver a la cola
+                    while not job.pending and job.remaining and job.error is None:
+                        job.cond.wait()
+                    if not job.remaining or job.error is not None:
+                        return
+                    index = job.pending.popleft()
+                try:
+                    result = self._call(worker, shards[index], index)
+                except OSError as e:
+                    self._drop(worker, e)
+                    with job.cond:
+                        job.pending.appendleft(index)
+                        job.reassigned += 1
+                        job.cond.notify_all()
+                    return
+                except MeshError as e:
+                    with job.cond:
+                        job.error = e
+                        job.cond.notify_all()
+                    return
+                with job.cond:
+                    job.results[index] = result
+                    job.remaining -= 1
+                    worker.completed += 1
+                    job.cond.notify_all()
+        finally:
+            worker.busy = False
+
+    def _call(self, worker, shard, index):
+        send_frame(worker.sock, task=index, **shard)
+        reply = recv_frame(worker.sock)
+        if reply is None:
+            raise ConnectionError("El worker cerró la conexión")
+        if reply.op == OP_ERROR:
+            raise MeshError(f"Worker {worker.address}: {bytes(reply.payload).decode('utf-8')}")
+        return reply.payload
+
+    def _drop(self, worker, error):
+        worker.alive = False
+        worker.sock.close()
+        self.events.warning("mesh.coordinator", "[MIA-X] Worker {address} caído ({error}); su shard se reasigna",
+                            address=worker.address, error=error)
+
+def _split_address(value):
+    host, _, port = value.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Malla de absorción QVE (apiary_mesh)")
+    sub = parser.add_subparsers(dest="role", required=True)
+    worker = sub.add_parser("worker")
+    worker.add_argument("--connect", default=f"127.0.0.1:{DEFAULT_PORT}")
+    worker.add_argument("--processes", type=int, default=1)
+    worker.add_argument("--retry", type=float, default=30.0)
+    coordinator = sub.add_parser("coordinator")
+    coordinator.add_argument("--host", default="0.0.0.0")
+    coordinator.add_argument("--port", type=int, default=DEFAULT_PORT)
+    coordinator.add_argument("--workers", type=int, default=1, help="workers a esperar antes de repartir")
+    coordinator.add_argument("--local", action="store_true", help="lanza los workers en este mismo host")
+    coordinator.add_argument("--source", help="archivo de ticks float64")
+    coordinator.add_argument("--synthetic", type=int, default=0, help="genera N ticks sintéticos si no hay --source")
+    coordinator.add_argument("--signals", choices=SIGNAL_MODES)
+    coordinator.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_ELEMENTS)
+    args = parser.parse_args(argv)
+
+    if args.role == "worker":
+        host, port = _split_address(args.connect)
+        # Varios procesos por nodo: uno por núcleo; cada uno es un worker independiente de la malla
+        extra = [subprocess.Popen([sys.executable, "-m", "core.apiary_mesh", "worker", "--connect", args.connect,
+                                   "--retry", str(args.retry)], cwd=ROOT) for _ in range(args.processes - 1)]
+        serve_worker(host, port, args.retry)
+        for process in extra:
+            process.wait()
+        return 0
+
+    with ApiaryMesh(args.host, args.port).start() as mesh:
+        if args.local:
+            mesh.spawn_local(args.workers)
+        mesh.wait_for_workers(args.workers)
+        source = args.source
+        if source is None:
+            source = 100_000.0 + np.cumsum(np.random.default_rng(1618).normal(0.0, 250.0, args.synthetic))
+        start = time.perf_counter()
+        result = mesh.open_black_hole(source, chunk_size=args.chunk_size)
+        print(f"[MIA-X] Liquidez generada: {result['liquidity_generated']:.6e} | {result['shards']} shards | "
+              f"{len(mesh.workers)} workers | {time.perf_counter() - start:.3f}s")
+        if args.signals:
+            prices = np.fromfile(source) if isinstance(source, str) else source
+            codes = mesh.btc_pull_signals(prices, mode=args.signals)
+            print(f"[MIA-X] Señales {args.signals}: {int(codes.sum())} CONSOLIDATE de {codes.size}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import numpy as np
+
+# Universo de activos QVE: H2O_RWA_Protocol ($H2O/$LIT/$RWA) + Quantum_Tokenizer (BTC/ETH/SOL)
+DEFAULT_UNIVERSE = ("H2O", "LIT", "RWA", "BTC", "ETH", "SOL")
+PROFIT_EPSILON = 1e-12  # margen en espacio logarítmico para ignorar ruido de punto flotante
+
+class ArbitrageScanner:
+    """Escáner de arbitraje cruzado sobre una matriz N×N de tasas en espacio logarítmico.
+
+    rates[i, j] = unidades de j recibidas por 1 unidad de i. Un ciclo es rentable
+    si la suma de log-tasas es positiva (ciclo negativo sobre -log). Los triángulos
+    se mantienen en un tensor N×N×N que se actualiza solo en las filas y columnas
+    afectadas por cada cotización nueva.
+    """
+    def __init__(self, assets=DEFAULT_UNIVERSE, rates=None):
+        self.assets = list(assets)
+        self.index = {asset: i for i, asset in enumerate(self.assets)}
+        n = len(self.assets)
+        if rates is None:
+            rates = np.ones((n, n))
+        self.set_rates(rates)
+
+    def set_rates(self, rates):
+        rates = np.asarray(rates, dtype=np.float64)
+        n = len(self.assets)
+        if rates.shape != (n, n):
+            raise ValueError(f"Se esperaba una matriz {n}x{n}, recibida {rates.shape}")
+        with np.errstate(divide="ignore"):
+            self.log_rates = np.log(rates)
+        np.fill_diagonal(self.log_rates, 0.0)
+        lr = self.log_rates
+        # triangles[a, b, c] = log(r_ab) + log(r_bc) + log(r_ca)
+        self.triangles = lr[:, :, None] + lr[None, :, :] + lr.T[:, None, :]
+        # Triángulos degenerados (índices repetidos) quedan en -inf y así se mantienen al actualizar
+        idx = np.arange(n)
+        self.triangles[idx, idx, :] = -np.inf
+        self.triangles[:, idx, idx] = -np.inf
+        self.triangles[idx, :, idx] = -np.inf
+
+    def update_rate(self, base, quote, rate):
+        i, j = self.index[base], self.index[quote]
+        if i == j:
+            return
+        with np.errstate(divide="ignore"):
+            delta = np.log(rate) - self.log_rates[i, j]
+        if delta == 0:
+            return
+        if not np.isfinite(delta):
+            # Una tasa en cero (par suspendido) entra o sale: reconstrucción completa
+            rates = np.exp(self.log_rates)
+            rates[i, j] = rate
+            self.set_rates(rates)
+            return
+        self.log_rates[i, j] += delta
+        # Solo los triángulos que usan la arista i->j: O(N) en vez de reconstruir N³
+        self.triangles[i, j, :] += delta
+        self.triangles[:, i, j] += delta
+        self.triangles[j, :, i] += delta
+
+    def update_quotes(self, quotes):
+        # quotes: {(base, quote): rate}
+        for (base, quote), rate in quotes.items():
+            self.update_rate(base, quote, rate)
+
+    def best_triangle(self):
+        flat = int(np.argmax(self.triangles))
+        a, b, c = np.unravel_index(flat, self.triangles.shape)
+        profit = self.triangles[a, b, c]
+        if profit <= PROFIT_EPSILON:
+            return None
+        return self._opportunity([a, b, c], profit)
+
+    def triangles_above(self, min_profit=0.0):
+        threshold = max(np.log1p(min_profit), PROFIT_EPSILON)
+        hits = np.argwhere(self.triangles > threshold)
+        # Cada triángulo aparece rotado 3 veces; se conserva la rotación que empieza en el menor índice
+        hits = hits[(hits[:, 0] < hits[:, 1]) & (hits[:, 0] < hits[:, 2])]
+        return [self._opportunity(list(hit), self.triangles[tuple(hit)]) for hit in hits]
+
+    def find_negative_cycle(self):
+        """Bellman-Ford vectorizado sobre -log(tasas) desde un origen virtual.
+
+        Devuelve la oportunidad multi-salto detectada (ciclo de cualquier largo)
+        o None si no hay ciclos rentables.
+        """
+        n = len(self.assets)
+        weights = -self.log_rates
+        cols = np.arange(n)
+        dist = np.zeros(n)
+        pred = np.full(n, -1)
+        for round_ in range(1, n + 1):
+            candidates = dist[:, None] + weights
+            best_from = np.argmin(candidates, axis=0)
+            best = candidates[best_from, cols]
+            improved = best < dist - PROFIT_EPSILON
+            if not improved.any():
+                return None
+            dist[improved] = best[improved]
+            pred[improved] = best_from[improved]
+            # Cualquier ciclo en el grafo de predecesores ya es rentable: se revisa cada pocas rondas
+            if round_ % 4 == 0 or round_ == n:
+                cycle = self._pred_cycle(pred)
+                if cycle:
+                    profit = sum(self.log_rates[cycle[k], cycle[(k + 1) % len(cycle)]] for k in range(len(cycle)))
+                    if profit > PROFIT_EPSILON:
+                        return self._opportunity(cycle, profit)
+        return None
+
+    @staticmethod
+    def _pred_cycle(pred):
+        state = [0] * len(pred)  # 0 = sin visitar, 1 = en el recorrido actual, 2 = cerrado
+        for start in range(len(pred)):
+            path = []
+            node = start
+            while node >= 0 and state[node] == 0:
+                state[node] = 1
+                path.append(node)
+                node = int(pred[node])
+            if node >= 0 and state[node] == 1:
+                cycle = path[path.index(node):]
+                cycle.reverse()
+                return cycle
+            for visited in path:
+                state[visited] = 2
+        return None
+
+    def scan(self):
+        return {"triangular": self.best_triangle(), "multi_hop": self.find_negative_cycle()}
+
+    def _opportunity(self, cycle, log_profit):
+        path = [self.assets[i] for i in cycle]
+        return {"path": path + [path[0]], "profit": float(np.expm1(log_profit))}
@@ -0,0 +1,235 @@
+import os
+import atexit
+import struct
+import threading
+import time
+import functools
+
+from core.lazy import lazy_import
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin flock, el único escritor por directorio queda a cargo del llamador
+    fcntl = None
+
+np = lazy_import("numpy")  # solo la lectura/agregación lo usa; los escritores no lo cargan
+
+# --- QVE CONVERSION LEDGER: registro durable de absorción de deuda ---
+# Registros binarios de ancho fijo en segmentos append-only. Un hilo de commit
+# agrupa los registros de todos los llamadores concurrentes en una sola
+# escritura + fsync (group commit). La lectura mapea los segmentos con np.memmap.
+
+RECORD = struct.Struct("<qB23sd")  # ts_ns, kind, clave (país/fuente), monto
+KEY_BYTES = 23
+
+KIND_DEBT_CONVERSION = 0    # MarketAbsorber.convert_debt_to_infrastructure
+KIND_TRADITIONAL_DEBT = 1   # GlobalAbsorber.absorb_traditional_debt
+DEFAULT_LEDGER_DIR = "ledger/conversions"
+DEFAULT_SEGMENT_BYTES = RECORD.size * (1 << 20)  # ~40 MB por segmento
+WRITER_LOCK = ".writer.lock"
+
+@functools.lru_cache(maxsize=None)
+def _record_dtype():
+    dtype = np.dtype([("ts", "<i8"), ("kind", "u1"), ("key", "S23"), ("amount", "<f8")])
+    assert dtype.itemsize == RECORD.size
+    return dtype
+
+def __getattr__(name):
+    # RECORD_DTYPE se construye al primer acceso (PEP 562) para no importar NumPy al escribir
+    if name == "RECORD_DTYPE":
+        return _record_dtype()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _segment_name(index):
+    return f"segment-{index:06d}.qvl"
+
+def _segments(directory):
+    # Sin glob (fnmatch + re): los escritores de vida corta arrancan más rápido
+    try:
+        names = [name for name in os.listdir(directory) if name.startswith("segment-") and name.endswith(".qvl")]
+    except FileNotFoundError:
+        return []
+    return [os.path.join(directory, name) for name in sorted(names)]
+
+class ConversionLedger:
+    """Ledger append-only con group commit. Un único escritor por directorio (flock sobre WRITER_LOCK)."""
+    def __init__(self, directory=DEFAULT_LEDGER_DIR, segment_bytes=DEFAULT_SEGMENT_BYTES,
+                 max_batch=4096, fsync=True):
+        self.directory = directory
+        self.segment_bytes = segment_bytes - segment_bytes % RECORD.size
+        self.max_batch = max_batch
+        self.fsync = fsync
+        os.makedirs(directory, exist_ok=True)
+        self._lock_directory()
+        self._open_last_segment()
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)
+        self._done = threading.Condition(self._lock)
+        self._pending = []
+        self._appended = 0
+        self._durable = 0
+        self._closing = False
+        self._closed = False
+        self._error = None
+        self._committer = threading.Thread(target=self._commit_loop, name="qve-ledger-commit", daemon=True)
+        self._committer.start()
+
+    def _lock_directory(self):
+        # Sin este candado, un segundo escritor truncaría como "registro cortado" un append en vuelo del primero
+        self._writer_lock = open(os.path.join(self.directory, WRITER_LOCK), "a")
+        if fcntl is None:
+            return
+        try:
+            fcntl.flock(self._writer_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self._writer_lock.close()
+            raise RuntimeError(f"El ledger {self.directory} ya tiene un escritor abierto") from None
+
+    def _open_last_segment(self):
+        existing = _segments(self.directory)
+        self._segment_index = int(os.path.basename(existing[-1])[8:14]) if existing else 0
+        path = os.path.join(self.directory, _segment_name(self._segment_index))
+        self._file = open(path, "ab")
+        size = self._file.seek(0, os.SEEK_END)
+        if size % RECORD.size:
+            # Escritura cortada por una caída: se descarta el registro incompleto
+            self._file.truncate(size - size % RECORD.size)
+        self._segment_size = size - size % RECORD.size
+
+    def append(self, kind, key, amount, wait=True):
+        """Agrega un registro; con wait=True vuelve cuando su lote ya está en disco."""
+        encoded = str(key).encode("utf-8")
+        if len(encoded) > KEY_BYTES:
+            # Truncar fusionaría en aggregate() claves con el mismo prefijo (o cortaría un carácter UTF-8)
+            raise ValueError(f"Clave de ledger demasiado larga ({len(encoded)} bytes, máximo {KEY_BYTES}): {key!r}")
+        record = RECORD.pack(time.time_ns(), kind, encoded, float(amount))
+        with self._lock:
+            if self._closing:
+                raise self._error or RuntimeError("Ledger cerrado")
+            self._pending.append(record)
+            self._appended += 1
+            seq = self._appended
+            self._work.notify()
+            if wait:
+                self._wait_durable(seq)
+        return seq
+
+    def flush(self):
+        with self._lock:
+            self._wait_durable(self._appended)
+
+    def close(self):
+        """Espera lo encolado y libera segmento y flock; relanza un error de commit pendiente."""
+        error = None
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._wait_durable(self._appended)
+            except OSError as e:
+                error = e
+            self._closing = True
+            self._work.notify()
+        try:
+            self._committer.join()
+        finally:
+            # También tras un commit fallido: el archivo y el candado de escritor no quedan tomados
+            self._file.close()
+            self._writer_lock.close()
+        if error is not None:
+            raise error
+
+    def _wait_durable(self, seq):
+        while self._durable < seq:
+            if self._error:
+                raise self._error
+            self._done.wait()
+
+    def _commit_loop(self):
+        while True:
+            with self._lock:
+                while not self._pending and not self._closing:
+                    self._work.wait()
+                if not self._pending:
+                    return
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                upto = self._durable + len(batch)
+            # Escritura y fsync fuera del lock: los llamadores siguen encolando el próximo lote
+            try:
+                self._write_batch(batch)
+            except OSError as e:
+                with self._lock:
+                    self._error = e
+                    self._closing = True
+                    self._done.notify_all()
+                return
+            with self._lock:
+                self._durable = upto
+                self._done.notify_all()
+
+    def _write_batch(self, batch):
+        while batch:
+            room = (self.segment_bytes - self._segment_size) // RECORD.size
+            if room <= 0:
+                self._rotate()
+                continue
+            chunk, batch = batch[:room], batch[room:]
+            data = b"".join(chunk)
+            self._file.write(data)
+            self._segment_size += len(data)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def _rotate(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._file.close()
+        self._segment_index += 1
+        self._file = open(os.path.join(self.directory, _segment_name(self._segment_index)), "ab")
+        self._segment_size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_records(directory=DEFAULT_LEDGER_DIR):
+    """Itera los segmentos como arrays estructurados mapeados en memoria (sin copiar)."""
+    for path in _segments(directory):
+        count = os.path.getsize(path) // RECORD.size
+        if count:
+            yield np.memmap(path, dtype=_record_dtype(), mode="r", shape=(count,))
+
+def aggregate(directory=DEFAULT_LEDGER_DIR, kind=None):
+    """Total absorbido por país/fuente, agregado en NumPy sin crear objetos por registro."""
+    totals = {}
+    for records in read_records(directory):
+        if kind is not None:
+            records = records[records["kind"] == kind]
+        keys, inverse = np.unique(records["key"], return_inverse=True)
+        sums = np.bincount(inverse, weights=records["amount"], minlength=len(keys))
+        for key, amount in zip(keys.tolist(), sums.tolist()):
+            name = key.decode("utf-8", errors="replace")
+            totals[name] = totals.get(name, 0.0) + amount
+    return totals
+
+_ledgers = {}
+_ledgers_lock = threading.Lock()
+
+def get_ledger(directory=DEFAULT_LEDGER_DIR):
+    # Un ledger compartido por directorio y proceso, para que todos los absorbedores agrupen commits juntos
+    with _ledgers_lock:
+        if directory not in _ledgers:
+            _ledgers[directory] = ConversionLedger(directory)
+        return _ledgers[directory]
+
+@atexit.register
+def _close_ledgers():
+    # Los registros encolados con wait=False se confirman antes de salir
+    for ledger in list(_ledgers.values()):
+        ledger.close()
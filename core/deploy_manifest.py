@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from core.timing import timed
+
+# --- QVE DEPLOY LAYER: escrituras incrementales para los inyectores de código ---
+# Un manifiesto guarda (sha256, tamaño, mtime) de cada archivo generado. Los
+# archivos sin cambios no se tocan; los modificados se escriben de forma atómica.
+
+DEFAULT_MANIFEST = ".qve_deploy_manifest.json"
+
+def content_digest(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+def _read_umask():
+    # os.umask solo se puede leer cambiándola: se hace una vez al importar, antes de los hilos de escritura
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+# Permisos que tendría un open() normal para los archivos nuevos
+DEFAULT_FILE_MODE = 0o666 & ~_read_umask()
+
+def atomic_write(path, content):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = DEFAULT_FILE_MODE
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".qve-", suffix=".tmp")
+    try:
+        # mkstemp crea el temporal con 0600 y os.replace lo conservaría: se restauran los permisos
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+class DeployManifest:
+    """Manifiesto de hashes de contenido para despliegues idempotentes."""
+    def __init__(self, path=DEFAULT_MANIFEST):
+        self.path = path
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    def is_current(self, path, digest):
+        # Sin lecturas si el stat coincide con lo registrado; si no, se compara el contenido real
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return False
+        entry = self.entries.get(path)
+        if entry and entry["sha256"] == digest and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            return True
+        with open(path, encoding="utf-8", newline="") as f:
+            if content_digest(f.read()) != digest:
+                return False
+        self.record(path, digest)
+        return True
+
+    def record(self, path, digest):
+        st = os.stat(path)
+        self.entries[path] = {"sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def save(self):
+        atomic_write(self.path, json.dumps(self.entries, indent=2, sort_keys=True))
+
+def sync_file(manifest, path, content, create_only=False):
+    """Escribe un único archivo si cambió; devuelve "created", "updated" o "unchanged"."""
+    digest = content_digest(content)
+    exists = os.path.exists(path)
+    if (exists and create_only) or manifest.is_current(path, digest):
+        return "unchanged"
+    atomic_write(path, content)
+    manifest.record(path, digest)
+    return "updated" if exists else "created"
+
+@timed("deploy.deploy_files")
+def deploy_files(files, manifest=None, dry_run=False, create_only=(), workers=8):
+    """Despliega {ruta: contenido} escribiendo solo lo que cambió.
+
+    Devuelve {"created", "updated", "unchanged", "diff"}. Con dry_run=True no se
+    escribe nada y "diff" contiene el diff unificado de cada archivo pendiente.
+    Las rutas en `create_only` solo se escriben si aún no existen.
+    """
+    manifest = manifest or DeployManifest()
+    report = {"created": [], "updated": [], "unchanged": [], "diff": ""}
+    pending = []
+    before = dict(manifest.entries)
+    for path, content in files.items():
+        digest = content_digest(content)
+        exists = os.path.exists(path)
+        if (exists and path in create_only) or manifest.is_current(path, digest):
+            report["unchanged"].append(path)
+            continue
+        report["updated" if exists else "created"].append(path)
+        pending.append((path, content, digest))
+
+    if dry_run:
+        report["diff"] = "".join(_unified_diff(path, content) for path, content, _ in pending)
+        return report
+
+    def write(item):
+        path, content, digest = item
+        atomic_write(path, content)
+        return path, digest
+
+    # Escrituras independientes en paralelo; el manifiesto se actualiza en el hilo principal
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as pool:
+        for path, digest in pool.map(write, pending):
+            manifest.record(path, digest)
+    if manifest.entries != before:
+        manifest.save()
+    return report
+
+def _unified_diff(path, content):
+    import difflib  # solo en --dry-run
+    try:
+        with open(path, encoding="utf-8", newline="") as f:
+            current = f.read()
+    except FileNotFoundError:
+        current = ""
+    return "".join(difflib.unified_diff(
+        current.splitlines(keepends=True), content.splitlines(keepends=True),
+        fromfile=f"a/{path}", tofile=f"b/{path}",
+    ))
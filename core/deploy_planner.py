@@ -0,0 +1,102 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from core.deploy_manifest import DeployManifest, sync_file
+
+# --- QVE DEPLOY PLANNER: un único DAG para todos los scripts de activación ---
+# Cada directorio, archivo y el arranque del runtime es un nodo con dependencias.
+# Los nodos listos se ejecutan en paralelo y se mide la ruta crítica del arranque.
+
+class DeployNode:
+    def __init__(self, name, action, deps=()):
+        self.name = name
+        self.action = action
+        self.deps = set(deps)
+        self.start = None
+        self.end = None
+        self.result = None
+
+    @property
+    def duration(self):
+        return (self.end or 0.0) - (self.start or 0.0)
+
+class DeployPlanner:
+    """Planificador de despliegue por dependencias (DAG) con ejecución concurrente."""
+    def __init__(self, manifest=None, workers=8):
+        self.manifest = manifest or DeployManifest()
+        self.workers = workers
+        self.nodes = {}
+
+    def add(self, name, action, deps=()):
+        if name in self.nodes:
+            self.nodes[name].deps.update(deps)
+        else:
+            self.nodes[name] = DeployNode(name, action, deps)
+        return name
+
+    def add_directory(self, path):
+        path = os.path.normpath(path)
+        parent = os.path.dirname(path)
+        # La raíz ("/" o "C:\\") es su propio padre: ahí termina la cadena de directorios
+        deps = [self.add_directory(parent)] if parent and parent != path else []
+        return self.add(f"dir:{path}", lambda: os.makedirs(path, exist_ok=True), deps)
+
+    def add_file(self, path, content, create_only=False, deps=()):
+        path = os.path.normpath(path)
+        parent = os.path.dirname(path)
+        deps = list(deps) + ([self.add_directory(parent)] if parent else [])
+        return self.add(f"file:{path}", lambda: sync_file(self.manifest, path, content, create_only), deps)
+
+    def execute(self):
+        """Ejecuta el DAG; un nodo arranca apenas terminan todas sus dependencias."""
+        missing = {dep for node in self.nodes.values() for dep in node.deps if dep not in self.nodes}
+        if missing:
+            raise ValueError(f"Dependencias no declaradas: {sorted(missing)}")
+        remaining = {name: set(node.deps) for name, node in self.nodes.items()}
+        before = dict(self.manifest.entries)
+        self.t0 = time.perf_counter()
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while remaining or running:
+                for name in [name for name, deps in remaining.items() if not deps]:
+                    del remaining[name]
+                    running[pool.submit(self._run, self.nodes[name])] = name
+                if not running:
+                    raise ValueError(f"Ciclo de dependencias entre: {sorted(remaining)}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    future.result()
+                    for deps in remaining.values():
+                        deps.discard(name)
+        if self.manifest.entries != before:
+            self.manifest.save()
+        return self.nodes
+
+    def _run(self, node):
+        node.start = time.perf_counter() - self.t0
+        node.result = node.action()
+        node.end = time.perf_counter() - self.t0
+
+    def critical_path(self):
+        # Recorre hacia atrás desde el último nodo en terminar, siguiendo la dependencia más tardía
+        if not self.nodes:
+            return []
+        node = max(self.nodes.values(), key=lambda n: n.end)
+        path = [node]
+        while node.deps:
+            node = max((self.nodes[dep] for dep in node.deps), key=lambda n: n.end)
+            path.append(node)
+        return path[::-1]
+
+    def timing_report(self):
+        lines = [f"{'nodo':<58}{'inicio ms':>10}{'dur ms':>9}"]
+        for node in sorted(self.nodes.values(), key=lambda n: n.start):
+            lines.append(f"{node.name:<58}{node.start * 1e3:10.2f}{node.duration * 1e3:9.2f}")
+        lines.append("--- ruta crítica ---")
+        for node in self.critical_path():
+            lines.append(f"{node.name:<58}{node.start * 1e3:10.2f}{node.duration * 1e3:9.2f}")
+        total = max((node.end for node in self.nodes.values()), default=0.0)
+        lines.append(f"TOTAL: {total * 1e3:.2f} ms")
+        return "\n".join(lines)
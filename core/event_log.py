@@ -0,0 +1,188 @@
+import os
+import sys
+import time
+import atexit
+import functools
+import threading
+from collections import deque
+
+# --- QVE EVENT LOG: eventos estructurados con escritura diferida ---
+# Los métodos calientes no escriben en stdout: encolan una tupla en un buffer
+# circular (deque.append es atómico bajo el GIL, sin lock) y un hilo de fondo
+# formatea y escribe por lotes. Un nivel por debajo del umbral cuesta una sola
+# comparación. Formato "text" (los mensajes de siempre) o "json" (JSON lines).
+#
+# Configuración por entorno: QVE_LOG_LEVEL, QVE_LOG_FORMAT, QVE_LOG_FILE.
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+LEVELS = {"DEBUG": DEBUG, "INFO": INFO, "WARNING": WARNING, "ERROR": ERROR, "OFF": OFF}
+LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+FORMATS = ("text", "json")
+DEFAULT_CAPACITY = 1 << 16
+
+class EventLog:
+    """Registro de eventos con buffer circular acotado y un hilo de drenaje."""
+    def __init__(self, level=INFO, fmt="text", stream=None, capacity=DEFAULT_CAPACITY, flush_interval=0.05):
+        self.level = self._check_level(level)
+        self.fmt = self._check_format(fmt)
+        self.stream = stream  # None = sys.stdout en el momento de escribir (respeta redirecciones)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.written = 0
+        self._buffer = deque()
+        self._high_water = max(1, capacity // 2)
+        self._wake = threading.Event()
+        self._drain_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+    @staticmethod
+    def _check_level(level):
+        if isinstance(level, str):
+            if level.upper() not in LEVELS:
+                raise ValueError(f"Nivel de eventos desconocido: {level}. Use uno de {tuple(LEVELS)}")
+            return LEVELS[level.upper()]
+        return level
+
+    @staticmethod
+    def _check_format(fmt):
+        if fmt not in FORMATS:
+            raise ValueError(f"Formato de eventos desconocido: {fmt}. Use uno de {FORMATS}")
+        return fmt
+
+    def configure(self, level=None, fmt=None, stream=None):
+        """Cambia nivel/formato/destino en caliente; lo ya encolado se escribe con la configuración anterior."""
+        self.flush()
+        if level is not None:
+            self.level = self._check_level(level)
+        if fmt is not None:
+            self.fmt = self._check_format(fmt)
+        if stream is not None:
+            self.stream = stream
+        return self
+
+    def enabled(self, level):
+        return level >= self.level
+
+    def emit(self, level, source, message, **fields):
+        """Encola un evento. `message` es una plantilla str.format que se resuelve en el hilo de drenaje."""
+        if level >= self.level:
+            self._enqueue(level, source, message, fields)
+
+    # Atajos por nivel: el filtro se evalúa antes de tocar el buffer
+    def debug(self, source, message, **fields):
+        if DEBUG >= self.level:
+            self._enqueue(DEBUG, source, message, fields)
+
+    def info(self, source, message, **fields):
+        if INFO >= self.level:
+            self._enqueue(INFO, source, message, fields)
+
+    def warning(self, source, message, **fields):
+        if WARNING >= self.level:
+            self._enqueue(WARNING, source, message, fields)
+
+    def error(self, source, message, **fields):
+        if ERROR >= self.level:
+            self._enqueue(ERROR, source, message, fields)
+
+    def flush(self):
+        """Escribe todo lo encolado hasta ahora, de forma síncrona."""
+        self._drain()
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._drain()
+
+    def _enqueue(self, level, source, message, fields):
+        buffer = self._buffer
+        if len(buffer) >= self.capacity:
+            # Buffer lleno: se descarta el evento nuevo (el llamador nunca espera a la terminal)
+            self.dropped += 1
+            return
+        buffer.append((time.time(), level, source, message, fields))
+        if self._thread is None:
+            self._start()
+        elif self._closed:
+            # Eventos emitidos durante el apagado (otros atexit): ya no hay hilo, se escriben directo
+            self._drain()
+        elif len(buffer) >= self._high_water:
+            self._wake.set()
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._drain_loop, name="qve-event-log", daemon=True)
+                self._thread.start()
+
+    def _drain_loop(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain()
+
+    def _drain(self):
+        # Un solo drenador a la vez para conservar el orden de los eventos
+        with self._drain_lock:
+            buffer = self._buffer
+            lines = []
+            while buffer:
+                lines.append(self._format(buffer.popleft()))
+            if not lines:
+                return
+            stream = self.stream or sys.stdout
+            try:
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+            except (OSError, ValueError):
+                # Destino cerrado (p. ej. stdout al apagar el intérprete): no hay dónde reportarlo
+                return
+            self.written += len(lines)
+
+    def _format(self, record):
+        ts, level, source, message, fields = record
+        text = message.format(**fields) if fields else message
+        if self.fmt == "text":
+            return text
+        event = {"ts": ts, "level": LEVEL_NAMES.get(level, level), "source": source, "message": text}
+        event.update(fields)
+        return _json_encoder().encode(event)
+
+@functools.lru_cache(maxsize=None)
+def _json_encoder():
+    # Un solo encoder reutilizado; json se importa recién cuando se pide formato JSON
+    import json
+    return json.JSONEncoder(ensure_ascii=False, default=str)
+
+_event_log = None
+_event_log_lock = threading.Lock()
+
+def get_event_log():
+    # Un registro compartido por proceso para que todos los módulos escriban en un solo lote ordenado
+    global _event_log
+    if _event_log is None:
+        with _event_log_lock:
+            if _event_log is None:
+                path = os.environ.get("QVE_LOG_FILE")
+                stream = open(path, "a", encoding="utf-8", buffering=1 << 16) if path else None
+                _event_log = EventLog(
+                    level=os.environ.get("QVE_LOG_LEVEL", "INFO"),
+                    fmt=os.environ.get("QVE_LOG_FORMAT", "text").lower(),
+                    stream=stream,
+                )
+    return _event_log
+
+@atexit.register
+def _close_event_log():
+    # Los eventos aún encolados se escriben antes de salir
+    if _event_log is not None:
+        _event_log.close()
@@ -0,0 +1,238 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from core.event_log import get_event_log
+from security.master_vault.master_validator import IdentityGuard
+
+# --- DEAL GATEWAY SERVER: HTTP/1.1 asyncio para clientes institucionales ---
+# Keep-alive y pipelining por conexión (respuestas en orden), colas acotadas que
+# dejan de leer del socket cuando se llenan (backpressure TCP), límite global de
+# solicitudes en vuelo (503) y token bucket por cliente (429). La verificación de
+# IdentityGuard corre en un pool de hilos para no bloquear el event loop.
+
+STATUS_TEXT = {
+    200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+    413: "Payload Too Large", 429: "Too Many Requests", 503: "Service Unavailable",
+}
+PUBLIC_PATHS = {"/health"}
+
+class Request:
+    def __init__(self, method, path, version, headers, body=b""):
+        self.method = method
+        self.path = path
+        self.version = version
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self):
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def allow(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+class GatewayServer:
+    """Servidor asyncio del DEAL Gateway con backpressure y rate limiting por cliente."""
+    def __init__(self, host="127.0.0.1", port=8443, handler=None, guard=None,
+                 rate_limit=200.0, burst=400, pipeline_depth=16, max_inflight=4096,
+                 idle_timeout=30.0, max_body=1 << 20, auth_workers=4, auth_required=True):
+        self.host = host
+        self.port = port
+        self.handler = handler or self.default_handler
+        self.guard = guard or IdentityGuard()
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.pipeline_depth = pipeline_depth
+        self.max_inflight = max_inflight
+        self.idle_timeout = idle_timeout
+        self.max_body = max_body
+        self.auth_required = auth_required
+        self._auth_pool = ThreadPoolExecutor(max_workers=auth_workers, thread_name_prefix="qve-auth")
+        self._buckets = OrderedDict()  # por cliente, del menos al más recientemente usado
+        self._inflight = 0
+        self._server = None
+        self._connections = {}
+        self.stats = {"connections": 0, "requests": 0, "rejected_429": 0, "rejected_503": 0}
+        self.events = get_event_log()
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port, backlog=4096)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+        # Cerrar los sockets abiertos: cada conexión ve EOF y termina su ciclo normalmente
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        self._auth_pool.shutdown(wait=False)
+
+    async def default_handler(self, request):
+        body = {"gateway": "DEAL", "assets": ["H2O_Token", "RWA_Token", "Lithium_Core"], "path": request.path}
+        return 200, json.dumps(body), "application/json"
+
+    async def _handle_connection(self, reader, writer):
+        self.stats["connections"] += 1
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        client = writer.get_extra_info("peername")
+        client = client[0] if client else "local"
+        # Cola acotada por conexión: si el cliente envía más rápido de lo que respondemos, dejamos de leer
+        queue = asyncio.Queue(self.pipeline_depth)
+        responder = asyncio.create_task(self._respond(queue, writer, client))
+        try:
+            while not responder.done():
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), self.idle_timeout)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except ValueError as e:
+                    # El detalle queda en el log; el cliente recibe un cuerpo fijo
+                    self.events.warning("gateway.server", "[DEAL] Solicitud inválida de {client}: {error}",
+                                        client=client, error=str(e))
+                    await queue.put((400, "Bad Request"))
+                    break
+                if request is None:
+                    break
+                await queue.put(request)
+                if not request.keep_alive:
+                    break
+        finally:
+            await queue.put(None)
+            try:
+                await responder
+            except ConnectionError:
+                pass
+            writer.close()
+            self._connections.pop(task, None)
+
+    async def _read_request(self, reader):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                return None
+            raise
+        except asyncio.LimitOverrunError:
+            raise ValueError("Cabeceras demasiado grandes")
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise ValueError("Línea de solicitud inválida")
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0) or 0)
+        if length < 0:
+            raise ValueError("Content-Length negativo")
+        if length > self.max_body:
+            raise ValueError("Cuerpo demasiado grande")
+        body = await reader.readexactly(length) if length else b""
+        return Request(method, path, version, headers, body)
+
+    async def _respond(self, queue, writer, client):
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            if isinstance(item, tuple):
+                status, body = item
+                keep_alive = False
+                content_type = "text/plain"
+            else:
+                status, body, content_type = await self._dispatch(item, client)
+                keep_alive = item.keep_alive
+            writer.write(self._encode(status, body, content_type, keep_alive))
+            # drain() suspende la respuesta si el cliente no lee: backpressure hacia atrás
+            await writer.drain()
+
+    async def _dispatch(self, request, client):
+        self.stats["requests"] += 1
+        if self._inflight >= self.max_inflight:
+            self.stats["rejected_503"] += 1
+            return 503, "Gateway saturado", "text/plain"
+        if self.rate_limit is not None and not self._bucket(client).allow():
+            self.stats["rejected_429"] += 1
+            return 429, "Límite de solicitudes excedido", "text/plain"
+        self._inflight += 1
+        try:
+            if self.auth_required and request.path not in PUBLIC_PATHS:
+                if not await self._authorized(request):
+                    return 401, "Requiere Firma 3", "text/plain"
+            if request.path == "/health":
+                return 200, "OK", "text/plain"
+            return await self.handler(request)
+        finally:
+            self._inflight -= 1
+
+    def _bucket(self, client):
+        buckets = self._buckets
+        bucket = buckets.get(client)
+        if bucket is None:
+            self._sweep_buckets()
+            bucket = buckets[client] = TokenBucket(self.rate_limit, self.burst)
+        else:
+            buckets.move_to_end(client)
+        return bucket
+
+    def _sweep_buckets(self):
+        # Un bucket inactivo por más que su tiempo de recarga ya está lleno: descartarlo equivale a crearlo de nuevo
+        refill = self.burst / self.rate_limit if self.rate_limit else float("inf")
+        now = time.monotonic()
+        buckets = self._buckets
+        while buckets and now - next(iter(buckets.values())).updated >= refill:
+            buckets.popitem(last=False)
+
+    async def _authorized(self, request):
+        scheme, _, key = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not key:
+            return False
+        # Acierto de caché: respuesta inmediata; si no, el hash corre fuera del event loop
+        if self.guard.recently_verified(key):
+            return True
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._auth_pool, self.guard.verify_authority, key)
+
+    @staticmethod
+    def _encode(status, body, content_type, keep_alive):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'OK')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return head.encode("latin-1") + body
@@ -0,0 +1,21 @@
+import sys
+import importlib.util
+
+# --- QVE LAZY IMPORTS: dependencias pesadas cargadas al primer uso ---
+# Los procesos de vida corta (workers, scripts de activación) no pagan el import
+# de NumPy y compañía si la ruta que ejecutan no los necesita.
+
+def lazy_import(name):
+    """Devuelve el módulo `name`; si aún no está cargado, lo ejecuta recién al primer acceso a un atributo."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,37 @@
+import hashlib
+from collections import deque
+
+# --- LIFE TOKENS: hashing y deduplicación del Universal_Life_Mapper ---
+# Vive en un módulo importable por nombre para que el pool de procesos de
+# tokenize_bulk pueda enviar hash_life_batch a sus workers (también con spawn).
+
+TOKEN_ID_BYTES = 16
+
+def life_token_id(life_form_data):
+    # ID crudo: primeros 16 bytes del SHA3-512 (los 8 primeros son el token visible)
+    return hashlib.sha3_512(life_form_data.encode()).digest()[:TOKEN_ID_BYTES]
+
+def format_life_token(token_id):
+    return f"TOKEN_VIDA_SINCRO: {token_id[:8].hex().upper()} | STATUS: VIBRACIÓN_ALTA"
+
+def hash_life_batch(records):
+    sha3 = hashlib.sha3_512
+    return b"".join(sha3(record.encode()).digest()[:TOKEN_ID_BYTES] for record in records)
+
+class SeenSet:
+    """Conjunto de deduplicación con memoria fija: recuerda las últimas `capacity` entradas."""
+    def __init__(self, capacity=1_000_000):
+        self.capacity = capacity
+        self._order = deque()
+        self._members = set()
+
+    def add(self, record):
+        # Devuelve False si el registro ya estaba (duplicado)
+        key = hash(record)
+        if key in self._members:
+            return False
+        self._members.add(key)
+        self._order.append(key)
+        if len(self._order) > self.capacity:
+            self._members.discard(self._order.popleft())
+        return True
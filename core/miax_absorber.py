@@ -1,16 +1,193 @@
-import numpy as np
+import os
+from collections import deque
+
+from core.event_log import get_event_log
+from core.lazy import lazy_import
+from core.timing import timed
+
+np = lazy_import("numpy")  # se carga al primer cálculo, no al importar (start_miax no lo necesita)
+
+GOLDEN_RATIO = 1.618
+DEFAULT_CHUNK_ELEMENTS = 1 << 22  # ~32 MB por bloque en float64
+
+BTC_THRESHOLD = 100000
+# Códigos int8 de señal: índice en SIGNALS
+SIGNAL_BUY_SUPPORT = 0
+SIGNAL_CONSOLIDATE = 1
+SIGNALS = ("SIGNAL: PULL_STRONG_BUY_SUPPORT", "SIGNAL: CONSOLIDATE_ABOVE_100K")
+SIGNAL_MODES = ("fixed", "rolling_mean", "hysteresis")
+ROLLING_BLOCK = 1 << 16  # bloques fijos de la media móvil (ver rolling_mean_range)
 
 class MIAX_Absorber:
     def __init__(self):
         self.version = "1.0.0-RELEASE"
         self.qve_standard = 25000000
-        
+        self.events = get_event_log()
+
+    @timed("miax_absorber.open_black_hole")
     def open_black_hole(self, market_data):
-        print("[MIA-X] Agujero Negro Abierto. Absorbiendo ineficiencias...")
-        absorption = np.sum(market_data) * 1.618
+        self.events.info("miax.absorber", "[MIA-X] Agujero Negro Abierto. Absorbiendo ineficiencias...")
+        absorption = np.sum(market_data) * GOLDEN_RATIO
         return {"liquidity_generated": absorption, "status": "STABLE"}
 
+    @timed("miax_absorber.open_black_hole_stream")
+    def open_black_hole_stream(self, source, dtype="float64", chunk_size=DEFAULT_CHUNK_ELEMENTS, partials=None):
+        """Absorción por bloques para archivos de ticks mayores que la RAM.
+
+        `source` puede ser la ruta de un archivo binario de ticks (se mapea con
+        np.memmap) o un iterable de bloques tipo array. Cada bloque se reduce con
+        np.sum (pairwise) y los parciales se acumulan con suma compensada de
+        Kahan-Neumaier. Si se entregan `partials` de una ejecución previa, esos
+        bloques se omiten y el trabajo se reanuda desde el siguiente.
+        """
+        done = list(partials or [])
+        chunks = self._iter_chunks(source, dtype, chunk_size, skip=len(done))
+        for chunk in chunks:
+            done.append(float(np.sum(chunk, dtype=np.float64)))
+        total = kahan_sum(done)
+        return {
+            "liquidity_generated": total * GOLDEN_RATIO,
+            "status": "STABLE",
+            "partials": done,
+        }
+
+    def _iter_chunks(self, source, dtype, chunk_size, skip=0):
+        if isinstance(source, (str, os.PathLike)):
+            if os.path.getsize(source) == 0:
+                return
+            ticks = np.memmap(source, dtype=dtype, mode="r")
+            for start in range(skip * chunk_size, ticks.shape[0], chunk_size):
+                yield ticks[start:start + chunk_size]
+            return
+        for index, chunk in enumerate(source):
+            if index >= skip:
+                yield np.asarray(chunk)
+
     def btc_pull_logic(self, price):
-        if price < 100000:
-            return "SIGNAL: PULL_STRONG_BUY_SUPPORT"
-        return "SIGNAL: CONSOLIDATE_ABOVE_100K"
\ No newline at end of file
+        if price < BTC_THRESHOLD:
+            return SIGNALS[SIGNAL_BUY_SUPPORT]
+        return SIGNALS[SIGNAL_CONSOLIDATE]
+
+    @timed("miax_absorber.btc_pull_signals")
+    def btc_pull_signals(self, prices, mode="fixed", window=20, band=0.02):
+        """Versión vectorizada de btc_pull_logic sobre un array de precios.
+
+        Devuelve un array int8 de códigos (ver SIGNALS / decode_signals).
+        Modos: "fixed" (umbral 100K), "rolling_mean" (media móvil de `window`
+        precios contra el umbral) e "hysteresis" (bandas ±`band` alrededor del
+        umbral; dentro de la banda se mantiene la señal anterior). Todo en O(n).
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        if mode == "fixed":
+            # Igual que btc_pull_logic: todo lo que no sea < 100K consolida (incluye NaN)
+            return (~(prices < BTC_THRESHOLD)).astype(np.int8)
+        if mode == "rolling_mean":
+            return (rolling_mean(prices, window) >= BTC_THRESHOLD).astype(np.int8)
+        if mode == "hysteresis":
+            return hysteresis_signals(prices, BTC_THRESHOLD * (1 - band), BTC_THRESHOLD * (1 + band))
+        raise ValueError(f"Modo de señal desconocido: {mode}")
+
+def decode_signals(codes):
+    return np.asarray(SIGNALS, dtype=object)[np.asarray(codes)]
+
+def rolling_mean(values, window):
+    # Media móvil; los primeros window-1 puntos usan la media expandida
+    if window < 1:
+        raise ValueError("window debe ser >= 1")
+    values = np.asarray(values, dtype=np.float64)
+    return rolling_mean_range(values, window, 0, len(values))
+
+def rolling_mean_range(values, window, begin, end, base=0):
+    """Medias móviles de los índices globales [begin, end).
+
+    `values` cubre los índices [base, end), con base <= max(0, begin - window).
+    La suma acumulada se reinicia en bloques fijos de ROLLING_BLOCK (con un halo
+    de `window` valores previos): así el resultado de un tramo alineado a
+    ROLLING_BLOCK es bit a bit el mismo que el del array completo, y la
+    magnitud acumulada no crece con la longitud de la serie.
+    """
+    means = np.empty(end - begin)
+    block_start = begin
+    while block_start < end:
+        block_end = min((block_start // ROLLING_BLOCK + 1) * ROLLING_BLOCK, end)
+        lo = max(0, block_start - window)
+        csum = np.zeros(block_end - lo + 1)
+        np.cumsum(values[lo - base:block_end - base], out=csum[1:])
+        idx = np.arange(block_start, block_end)
+        first = np.maximum(idx - window + 1, 0)
+        means[block_start - begin:block_end - begin] = (csum[idx + 1 - lo] - csum[first - lo]) / (idx + 1 - first)
+        block_start = block_end
+    return means
+
+def hysteresis_signals(prices, lower, upper):
+    codes = hysteresis_codes(prices, lower, upper)
+    if codes.size and codes[0] < 0:
+        # Sin estado previo: el tramo inicial dentro de la banda (único aún en -1) sigue al umbral del primer precio
+        codes[codes < 0] = SIGNAL_CONSOLIDATE if prices[0] >= BTC_THRESHOLD else SIGNAL_BUY_SUPPORT
+    return codes
+
+def hysteresis_codes(prices, lower, upper):
+    # Estado definido solo fuera de la banda; dentro se propaga el último estado (forward fill).
+    # El tramo inicial dentro de la banda queda en -1: depende del estado anterior al array.
+    codes = np.full(prices.shape, -1, dtype=np.int8)
+    codes[prices >= upper] = SIGNAL_CONSOLIDATE
+    codes[prices < lower] = SIGNAL_BUY_SUPPORT
+    if codes.size == 0:
+        return codes
+    idx = np.where(codes >= 0, np.arange(codes.size), 0)
+    np.maximum.accumulate(idx, out=idx)
+    return codes[idx]
+
+class SignalStream:
+    """Señales en vivo por símbolo con estado O(window); mismos resultados que btc_pull_signals."""
+    def __init__(self, mode="fixed", window=20, band=0.02):
+        if mode not in SIGNAL_MODES:
+            raise ValueError(f"Modo de señal desconocido: {mode}")
+        if window < 1:
+            raise ValueError("window debe ser >= 1")
+        self.mode = mode
+        self.window = window
+        self.lower = BTC_THRESHOLD * (1 - band)
+        self.upper = BTC_THRESHOLD * (1 + band)
+        self._state = {}
+
+    def update(self, symbol, price):
+        if self.mode == "fixed":
+            return SIGNAL_BUY_SUPPORT if price < BTC_THRESHOLD else SIGNAL_CONSOLIDATE
+        if self.mode == "rolling_mean":
+            prices, total = self._state.get(symbol) or (deque(maxlen=self.window), 0.0)
+            if len(prices) == self.window:
+                total -= prices[0]
+            prices.append(price)
+            total += price
+            self._state[symbol] = (prices, total)
+            return SIGNAL_CONSOLIDATE if total / len(prices) >= BTC_THRESHOLD else SIGNAL_BUY_SUPPORT
+        if price >= self.upper:
+            code = SIGNAL_CONSOLIDATE
+        elif price < self.lower:
+            code = SIGNAL_BUY_SUPPORT
+        else:
+            code = self._state.get(symbol)
+            if code is None:
+                code = SIGNAL_CONSOLIDATE if price >= BTC_THRESHOLD else SIGNAL_BUY_SUPPORT
+        self._state[symbol] = code
+        return code
+
+    def reset(self, symbol=None):
+        if symbol is None:
+            self._state.clear()
+        else:
+            self._state.pop(symbol, None)
+
+def kahan_sum(values):
+    # Suma compensada (Neumaier): estable al combinar miles de parciales
+    total = 0.0
+    compensation = 0.0
+    for value in values:
+        t = total + value
+        if abs(total) >= abs(value):
+            compensation += (total - t) + value
+        else:
+            compensation += (value - t) + total
+        total = t
+    return total + compensation
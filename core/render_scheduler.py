@@ -0,0 +1,166 @@
+import asyncio
+import os
+from collections import OrderedDict
+
+from core.lazy import lazy_import
+
+np = lazy_import("numpy")  # importar el módulo (p. ej. desde EONRenderer) no carga NumPy
+
+# --- EON RENDER SCHEDULER: cuadros 4K/8K/16K por tiles en paralelo ---
+# El cuadro vive en un bloque multiprocessing.shared_memory; cada worker escribe
+# su tile directamente ahí y solo devuelve coordenadas. Una caché de tiles por
+# contenido (LRU con tope de memoria) evita re-renderizar regiones sin cambios.
+# EONRenderer es el ciclo de vida común de los motores EON generados.
+
+RESOLUTIONS = {"4K": (3840, 2160), "8K": (7680, 4320), "16K": (15360, 8640)}
+CHANNELS = 3
+
+class Scene:
+    """Escena EON: dominio + elementos rectangulares (x, y, w, h, (r, g, b))."""
+    def __init__(self, domain, elements=()):
+        self.domain = domain
+        self.elements = [tuple(element[:4]) + (tuple(element[4]),) for element in elements]
+
+    def elements_in(self, x0, y0, x1, y1):
+        return tuple(
+            element for element in self.elements
+            if element[0] < x1 and element[0] + element[2] > x0 and element[1] < y1 and element[1] + element[3] > y0
+        )
+
+_attached = {}
+
+def _attach(name, shape):
+    frame = _attached.get(name)
+    if frame is None:
+        from multiprocessing import shared_memory
+        # Los workers del pool comparten el resource_tracker del proceso principal, que es quien hace unlink
+        shm = shared_memory.SharedMemory(name=name)
+        frame = _attached[name] = (shm, np.ndarray(shape, dtype=np.uint8, buffer=shm.buf))
+    return frame[1]
+
+def render_tile(shm_name, shape, x0, y0, x1, y1, domain, elements):
+    """Renderiza un tile en el cuadro compartido; función de módulo para el pool de procesos."""
+    frame = _attach(shm_name, shape)
+    height, width = shape[:2]
+    seed = sum(domain.encode()) % 256
+    xs = np.arange(x0, x1, dtype=np.float32)[None, :]
+    ys = np.arange(y0, y1, dtype=np.float32)[:, None]
+    tile = frame[y0:y1, x0:x1]
+    tile[..., 0] = xs * (255.0 / width)
+    tile[..., 1] = ys * (255.0 / height)
+    tile[..., 2] = 127.5 * (1.0 + np.sin(xs * 0.01 + seed) * np.cos(ys * 0.01))
+    for x, y, w, h, color in elements:
+        tile[max(y, y0) - y0:min(y + h, y1) - y0, max(x, x0) - x0:min(x + w, x1) - x0] = color
+    return x0, y0
+
+class TileCache:
+    """Caché LRU de tiles por clave de contenido con tope en bytes."""
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._tiles = OrderedDict()
+
+    def get(self, key):
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+        return tile
+
+    def put(self, key, tile):
+        if tile.nbytes > self.max_bytes:
+            return
+        old = self._tiles.pop(key, None)
+        if old is not None:
+            self.bytes -= old.nbytes
+        self._tiles[key] = tile
+        self.bytes += tile.nbytes
+        while self.bytes > self.max_bytes:
+            _, evicted = self._tiles.popitem(last=False)
+            self.bytes -= evicted.nbytes
+
+class TileRenderScheduler:
+    """Divide el cuadro en tiles y los reparte en un pool de procesos."""
+    def __init__(self, width, height, tile_size=512, workers=None, cache_bytes=512 << 20):
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.shape = (height, width, CHANNELS)
+        self.shm = shared_memory.SharedMemory(create=True, size=height * width * CHANNELS)
+        self.frame = np.ndarray(self.shape, dtype=np.uint8, buffer=self.shm.buf)
+        self.cache = TileCache(cache_bytes)
+        self.pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        self.stats = {"rendered": 0, "cached": 0, "unchanged": 0}
+        self._frame_keys = {}  # clave de contenido que ocupa hoy cada posición del cuadro
+
+    @classmethod
+    def for_resolution(cls, name, **options):
+        width, height = RESOLUTIONS[name]
+        return cls(width, height, **options)
+
+    def tiles(self):
+        for y0 in range(0, self.height, self.tile_size):
+            for x0 in range(0, self.width, self.tile_size):
+                yield x0, y0, min(x0 + self.tile_size, self.width), min(y0 + self.tile_size, self.height)
+
+    def render(self, scene):
+        """Renderiza `scene` en el cuadro compartido y devuelve la vista (alto, ancho, 3)."""
+        futures = {}
+        for x0, y0, x1, y1 in self.tiles():
+            elements = scene.elements_in(x0, y0, x1, y1)
+            key = (scene.domain, x0, y0, x1, y1, elements)
+            if self._frame_keys.get((x0, y0)) == key:
+                # El tile del cuadro anterior ya es correcto: ni render ni copia
+                self.stats["unchanged"] += 1
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.frame[y0:y1, x0:x1] = cached
+                self._frame_keys[(x0, y0)] = key
+                self.stats["cached"] += 1
+                continue
+            self._frame_keys.pop((x0, y0), None)
+            future = self.pool.submit(render_tile, self.shm.name, self.shape, x0, y0, x1, y1, scene.domain, elements)
+            futures[future] = (key, x0, y0, x1, y1)
+        for future, (key, x0, y0, x1, y1) in futures.items():
+            future.result()
+            self._frame_keys[(x0, y0)] = key
+            self.cache.put(key, self.frame[y0:y1, x0:x1].copy())
+            self.stats["rendered"] += 1
+        return self.frame
+
+    def close(self):
+        self.pool.shutdown()
+        del self.frame
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class EONRenderer:
+    """Base de los motores EON: el scheduler se crea al primer render y se libera en close()."""
+    resolution = "16K"
+    scheduler = None
+
+    async def render_scene(self, domain, elements=()):
+        # El render por tiles corre fuera del event loop
+        if self.scheduler is None:
+            self.scheduler = TileRenderScheduler.for_resolution(self.resolution)
+        return await asyncio.to_thread(self.scheduler.render, Scene(domain, elements))
+
+    def close(self):
+        # Libera el cuadro en memoria compartida (~400 MB en 16K) y el pool de procesos
+        if self.scheduler is not None:
+            self.scheduler.close()
+            self.scheduler = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
@@ -0,0 +1,125 @@
+import os
+import time
+import functools
+import threading
+
+# --- QVE TIMING REGISTRY: instrumentación de rutas calientes ---
+# @timed registra llamadas y un histograma de latencia por función (cubetas en
+# potencias de 2 de microsegundos, como el enjambre MIA-X). Apagado por defecto:
+# el envoltorio solo consulta una bandera. Se activa con QVE_TIMING=1 o
+# get_registry().enable(); el suite de benchmarks lo activa siempre.
+
+LATENCY_BUCKETS = 32  # <1us ... >=2^30us (~18 min)
+
+class TimingStats:
+    __slots__ = ("name", "calls", "errors", "total_ns", "max_ns", "buckets", "lock")
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * LATENCY_BUCKETS
+        self.lock = threading.Lock()
+
+    def record(self, elapsed_ns, failed=False):
+        bucket = min((elapsed_ns // 1000).bit_length(), LATENCY_BUCKETS - 1)
+        with self.lock:
+            self.calls += 1
+            self.errors += failed
+            self.total_ns += elapsed_ns
+            if elapsed_ns > self.max_ns:
+                self.max_ns = elapsed_ns
+            self.buckets[bucket] += 1
+
+    def percentile(self, fraction):
+        """Cota superior (en segundos) de la cubeta que contiene el percentil pedido."""
+        target = fraction * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return (1 << bucket) / 1e6
+        return 0.0
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "total_s": self.total_ns / 1e9,
+                "mean_s": self.total_ns / self.calls / 1e9 if self.calls else 0.0,
+                "max_s": self.max_ns / 1e9,
+                "p50_s": self.percentile(0.5),
+                "p99_s": self.percentile(0.99),
+                "histogram": {f"<{1 << bucket}us": count for bucket, count in enumerate(self.buckets) if count},
+            }
+
+class TimingRegistry:
+    """Estadísticas por nombre de función instrumentada."""
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+        return self
+
+    def disable(self):
+        self.enabled = False
+        return self
+
+    def stats(self, name):
+        stats = self._stats.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(name, TimingStats(name))
+        return stats
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self):
+        return {name: stats.snapshot() for name, stats in sorted(self._stats.items()) if stats.calls}
+
+    def report(self):
+        lines = [f"{'función':<48}{'llamadas':>10}{'media':>12}{'p50<=':>12}{'p99<=':>12}{'máx':>12}"]
+        for name, snap in self.snapshot().items():
+            lines.append(
+                f"{name:<48}{snap['calls']:>10}{_ms(snap['mean_s']):>12}{_ms(snap['p50_s']):>12}"
+                f"{_ms(snap['p99_s']):>12}{_ms(snap['max_s']):>12}"
+            )
+        return "\n".join(lines)
+
+def _ms(seconds):
+    return f"{seconds * 1e3:.3f}ms"
+
+_registry = TimingRegistry(enabled=os.environ.get("QVE_TIMING", "") not in ("", "0"))
+
+def get_registry():
+    return _registry
+
+def timed(name=None, registry=None):
+    """Decorador: cuenta llamadas y latencia de la función cuando el registro está activo."""
+    registry = registry or _registry
+
+    def decorate(fn):
+        stats_name = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter_ns()
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                registry.stats(stats_name).record(time.perf_counter_ns() - start, failed)
+        return wrapper
+    return decorate
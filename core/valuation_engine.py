@@ -0,0 +1,116 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# --- QVE VALUATION ENGINE: Monte Carlo para IPO_Sovereign ---
+# Valores terminales GBM correlacionados por entidad; los caminos se reparten en
+# shards de tamaño fijo con semillas derivadas de (seed, índice de shard), así el
+# resultado no depende de cuántos procesos participen.
+
+DEFAULT_ENTITIES = {
+    # entidad: (valor inicial USD, drift anual, volatilidad anual)
+    "DEAL_Institutional": (1.2e12, 0.08, 0.35),
+    "DALabs_Infra": (0.8e12, 0.06, 0.25),
+    "EON_Studios": (0.5e12, 0.12, 0.50),
+}
+DEFAULT_CORRELATION = [
+    [1.0, 0.6, 0.4],
+    [0.6, 1.0, 0.3],
+    [0.4, 0.3, 1.0],
+]
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+Z_95 = 1.959963984540054
+
+def _merge_moments(moments, values):
+    """Acumula (n, media, M2) por columna sin re-concatenar los shards (fórmula de Chan)."""
+    count, mean, m2 = len(values), values.mean(axis=0), values.var(axis=0) * len(values)
+    if moments is None:
+        return count, mean, m2
+    total, total_mean, total_m2 = moments
+    delta = mean - total_mean
+    merged = total + count
+    return merged, total_mean + delta * count / merged, total_m2 + m2 + delta ** 2 * total * count / merged
+
+def simulate_shard(shard_index, paths, seed, start, drift, vol, cholesky, horizon):
+    """Simula `paths` escenarios de un shard; función de módulo para poder enviarla al pool."""
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(shard_index,)))
+    shocks = rng.standard_normal((paths, len(start))) @ cholesky.T
+    log_growth = (drift - 0.5 * vol ** 2) * horizon + vol * np.sqrt(horizon) * shocks
+    return start * np.exp(log_growth)
+
+class ValuationEngine:
+    """Valoración Monte Carlo vectorizada con shards en paralelo y parada temprana."""
+    def __init__(self, entities=None, correlation=None, horizon=1.0, seed=2500):
+        entities = entities or DEFAULT_ENTITIES
+        self.names = list(entities)
+        params = np.array([entities[name] for name in self.names], dtype=np.float64)
+        self.start, self.drift, self.vol = params[:, 0], params[:, 1], params[:, 2]
+        correlation = np.asarray(DEFAULT_CORRELATION if correlation is None else correlation, dtype=np.float64)
+        self.cholesky = np.linalg.cholesky(correlation)
+        self.horizon = horizon
+        self.seed = seed
+
+    def run(self, paths=1_000_000, shard_size=250_000, workers=None, tolerance=None, quantiles=DEFAULT_QUANTILES,
+            check_every=1, min_paths=None):
+        """Simula hasta `paths` escenarios y devuelve estadísticas por entidad y del total.
+
+        Con `tolerance` (p. ej. 0.001) se detiene en el primer punto de control
+        (cada `check_every` shards, en orden de shard) con al menos `min_paths`
+        escenarios (por defecto un shard completo) en el que el semiancho del
+        IC 95% de cada media es menor que tolerance × media. Los puntos de control
+        no dependen de `workers`, así que el corte tampoco.
+        """
+        if paths < 2:
+            raise ValueError(f"Se necesitan al menos 2 caminos, no {paths}")
+        # Con pocas muestras la varianza estimada puede salir casi nula y cortar antes de tiempo
+        min_paths = max(2, shard_size if min_paths is None else min_paths)
+        workers = workers or os.cpu_count() or 1
+        shards = [min(shard_size, paths - offset) for offset in range(0, paths, shard_size)]
+        samples = []
+        converged = False
+        moments = None
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Ventana de shards en vuelo; los resultados se consumen en orden de índice
+            pending = deque()
+            next_shard = 0
+            while next_shard < len(shards) or pending:
+                while next_shard < len(shards) and len(pending) < 2 * workers:
+                    pending.append(pool.submit(simulate_shard, next_shard, shards[next_shard], self.seed, self.start,
+                                               self.drift, self.vol, self.cholesky, self.horizon))
+                    next_shard += 1
+                samples.append(pending.popleft().result())
+                if tolerance is None:
+                    continue
+                moments = _merge_moments(moments, samples[-1])
+                if moments[0] >= min_paths and len(samples) % check_every == 0 and self._converged(moments, tolerance):
+                    converged = True
+                    for future in pending:
+                        future.cancel()
+                    break
+        values = np.concatenate(samples)
+        return self._summarize(values, quantiles, converged if tolerance is not None else None)
+
+    def _converged(self, moments, tolerance):
+        count, mean, m2 = moments
+        half_width = Z_95 * np.sqrt(m2 / (count - 1)) / np.sqrt(count)
+        return bool(np.all(half_width < tolerance * np.abs(mean)))
+
+    def _summarize(self, values, quantiles, converged):
+        total = values.sum(axis=1)
+        report = {"paths": len(values), "converged": converged, "entities": {}}
+        columns = [(name, values[:, i]) for i, name in enumerate(self.names)] + [("TOTAL", total)]
+        for name, column in columns:
+            mean = float(column.mean())
+            std_error = float(column.std(ddof=1) / np.sqrt(len(column)))
+            stats = {
+                "mean": mean,
+                "std_error": std_error,
+                "ci95": (mean - Z_95 * std_error, mean + Z_95 * std_error),
+                "quantiles": dict(zip(quantiles, np.quantile(column, quantiles).tolist())),
+            }
+            if name == "TOTAL":
+                report["total"] = stats
+            else:
+                report["entities"][name] = stats
+        return report
@@ -0,0 +1,284 @@
+import os
+import mmap
+import bisect
+import struct
+import hashlib
+import threading
+import numpy as np
+
+# --- GALACTIC IP VAULT: almacén indexado de patentes ---
+# Formato en disco (todo alineado a 8 bytes, se abre con mmap sin parsear):
+#   cabecera | filtro Bloom | tabla hash (open addressing, u64 id+1) |
+#   offsets u64[n+1] | ids ordenados por nombre u64[n] | nombres UTF-8 concatenados
+# El filtro Bloom descarta casi todos los nombres nuevos sin tocar la tabla; la
+# tabla da el rechazo exacto de duplicados y el arreglo ordenado resuelve prefijos
+# con búsqueda binaria (equivalente compacto a un trie).
+# Las altas individuales se anexan a un journal (<ruta>.journal) apenas ocurren;
+# save() las compacta en el archivo base y vacía el journal, y al abrir el
+# almacén se reaplica lo que quedó en él.
+
+MAGIC = b"QVEPAT01"
+HEADER = struct.Struct("<8sQQIQQ")  # magic, n, bloom_bits, k, table_size, blob_len
+BLOOM_BITS_PER_NAME = 10
+BLOOM_HASHES = 7
+JOURNAL_RECORD = struct.Struct("<I")  # largo del nombre, seguido de sus bytes UTF-8
+DEFAULT_COMPACT_EVERY = 4096
+
+def name_hash(name_bytes):
+    return int.from_bytes(hashlib.blake2b(name_bytes, digest_size=8).digest(), "little")
+
+def _pad8(size):
+    return (size + 7) & ~7
+
+class _SortedNames:
+    """Vista de secuencia sobre los nombres en orden, para usar bisect sin materializarlos."""
+    def __init__(self, store):
+        self.store = store
+
+    def __len__(self):
+        return len(self.store._sorted)
+
+    def __getitem__(self, position):
+        return self.store._name(int(self.store._sorted[position]))
+
+class PatentStore:
+    """Registro de nombres de patentes con rechazo O(1) de duplicados y búsqueda por prefijo."""
+    def __init__(self, path=None, compact_every=DEFAULT_COMPACT_EVERY):
+        self.path = path
+        self.compact_every = compact_every
+        self._mmap = None
+        self._extra = {}        # altas posteriores a la última reconstrucción (dict: conserva el orden)
+        self._extra_sorted = []
+        self._journal = None
+        self._journaled = 0
+        self._lock = threading.RLock()  # altas concurrentes desde los workers del enjambre
+        if path and os.path.exists(path):
+            self._load(path)
+        else:
+            self._set_arrays(*self._build([]))
+        if path:
+            self._open_journal()
+
+    # --- Construcción e índices ---
+    def _build(self, encoded):
+        hashes = np.fromiter((name_hash(name) for name in encoded), dtype=np.uint64, count=len(encoded))
+        # Deduplicación por hash: solo los pares con el mismo hash se comparan byte a byte
+        order = np.argsort(hashes, kind="stable")
+        same = np.flatnonzero(hashes[order][1:] == hashes[order][:-1])
+        if same.size:
+            drop = set()
+            run = []
+            # Recorre cada grupo de hashes iguales (en orden de inserción) y descarta nombres repetidos
+            for i in same.tolist() + [None]:
+                if run and (i is None or i != run_end):
+                    names_in_run = set()
+                    for index in run:
+                        if encoded[index] in names_in_run:
+                            drop.add(index)
+                        names_in_run.add(encoded[index])
+                    run = []
+                if i is None:
+                    break
+                if not run:
+                    run = [int(order[i])]
+                run.append(int(order[i + 1]))
+                run_end = i + 1
+            keep = np.array([i not in drop for i in range(len(encoded))])
+            encoded = [name for name, kept in zip(encoded, keep.tolist()) if kept]
+            hashes = hashes[keep]
+        n = len(encoded)
+        bloom_bits = max(64, _pad8(n * BLOOM_BITS_PER_NAME))
+        bloom = np.zeros(bloom_bits // 8, dtype=np.uint8)
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        for i in range(BLOOM_HASHES):
+            positions = (h1 + np.uint64(i) * h2) % np.uint64(bloom_bits)
+            np.bitwise_or.at(bloom, (positions >> np.uint64(3)).astype(np.intp),
+                             (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8)))
+
+        table_size = 1 << max(3, (2 * n).bit_length())
+        table = np.zeros(table_size, dtype=np.uint64)
+        remaining = np.arange(n, dtype=np.uint64)
+        slots = hashes & np.uint64(table_size - 1)
+        while remaining.size:
+            # Cada ronda ubica a lo sumo un id por slot libre; los demás prueban el siguiente slot
+            free = table[slots.astype(np.intp)] == 0
+            candidates, first = np.unique(slots[free], return_index=True)
+            placed = np.flatnonzero(free)[first]
+            table[candidates.astype(np.intp)] = remaining[placed] + np.uint64(1)
+            keep = np.ones(remaining.size, dtype=bool)
+            keep[placed] = False
+            remaining = remaining[keep]
+            slots = (slots[keep] + np.uint64(1)) & np.uint64(table_size - 1)
+
+        lengths = np.fromiter((len(name) for name in encoded), dtype=np.uint64, count=n)
+        offsets = np.zeros(n + 1, dtype=np.uint64)
+        np.cumsum(lengths, out=offsets[1:])
+        width = int(lengths.max()) if n else 1
+        order = np.argsort(np.array(encoded, dtype=f"S{width}"), kind="stable").astype(np.uint64)
+        blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return bloom, table, offsets, order, blob
+
+    def _set_arrays(self, bloom, table, offsets, order, blob):
+        self._bloom = bloom
+        self._bloom_bits = bloom.size * 8
+        self._table = table
+        self._offsets = offsets
+        self._sorted = order
+        self._blob = blob
+        self._base_count = len(offsets) - 1
+
+    def _load(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, bloom_bits, k, table_size, blob_len = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or k != BLOOM_HASHES:
+            raise ValueError(f"{path} no es un almacén de patentes QVE válido")
+        offset = _pad8(HEADER.size)
+        sections = []
+        for dtype, count in ((np.uint8, bloom_bits // 8), (np.uint64, table_size), (np.uint64, n + 1), (np.uint64, n), (np.uint8, blob_len)):
+            sections.append(np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset))
+            offset += _pad8(count * np.dtype(dtype).itemsize)
+        self._set_arrays(*sections)
+
+    def _journal_path(self):
+        return f"{self.path}.journal"
+
+    def _open_journal(self):
+        # Reaplica las altas registradas después del último save y deja el journal abierto para anexar
+        journal = self._journal_path()
+        valid = 0
+        if os.path.exists(journal):
+            with open(journal, "rb") as f:
+                data = f.read()
+            while valid + JOURNAL_RECORD.size <= len(data):
+                (size,) = JOURNAL_RECORD.unpack_from(data, valid)
+                end = valid + JOURNAL_RECORD.size + size
+                if end > len(data):
+                    break
+                encoded = data[valid + JOURNAL_RECORD.size:end]
+                if encoded.decode("utf-8") not in self:
+                    self._insert(encoded)
+                self._journaled += 1
+                valid = end
+        else:
+            os.makedirs(os.path.dirname(journal) or ".", exist_ok=True)
+        self._journal = open(journal, "ab")
+        self._journal.truncate(valid)  # descarta un registro cortado por una caída a mitad de escritura
+
+    def _insert(self, encoded):
+        self._extra[encoded] = None
+        bisect.insort(self._extra_sorted, encoded)
+
+    def _name(self, name_id):
+        return self._blob[int(self._offsets[name_id]):int(self._offsets[name_id + 1])].tobytes()
+
+    def _base_contains(self, encoded, h):
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        for i in range(BLOOM_HASHES):
+            position = (h1 + i * h2) % self._bloom_bits
+            if not self._bloom[position >> 3] & (1 << (position & 7)):
+                return False
+        mask = len(self._table) - 1
+        slot = h & mask
+        while True:
+            entry = int(self._table[slot])
+            if entry == 0:
+                return False
+            if self._name(entry - 1) == encoded:
+                return True
+            slot = (slot + 1) & mask
+
+    # --- API pública ---
+    def __len__(self):
+        return self._base_count + len(self._extra)
+
+    def __contains__(self, name):
+        encoded = name.encode("utf-8")
+        return encoded in self._extra or self._base_contains(encoded, name_hash(encoded))
+
+    def add(self, name):
+        """Registra `name`; devuelve False si ya existía (duplicado rechazado)."""
+        with self._lock:
+            if name in self:
+                return False
+            encoded = name.encode("utf-8")
+            self._insert(encoded)
+            if self._journal is not None:
+                self._journal.write(JOURNAL_RECORD.pack(len(encoded)) + encoded)
+                self._journal.flush()
+                self._journaled += 1
+                # Compactar reconstruye todo el índice: el umbral crece con el almacén (costo amortizado constante)
+                if self._journaled >= max(self.compact_every, self._base_count >> 3):
+                    self.save()
+            return True
+
+    def bulk_import(self, names):
+        """Importa un lote grande reconstruyendo los índices de forma vectorizada; devuelve cuántos eran nuevos."""
+        with self._lock:
+            before = len(self)
+            self._rebuild(names)
+            if self.path:
+                self.save()
+            return len(self) - before
+
+    def _rebuild(self, names):
+        encoded = [self._name(i) for i in range(self._base_count)] + list(self._extra)
+        encoded.extend(name.encode("utf-8") for name in names)
+        self._extra.clear()
+        self._extra_sorted.clear()
+        self._set_arrays(*self._build(encoded))
+
+    def prefix_search(self, prefix, limit=20):
+        encoded = prefix.encode("utf-8")
+        matches = []
+        names = _SortedNames(self)
+        position = bisect.bisect_left(names, encoded)
+        while position < len(names) and len(matches) < limit:
+            name = names[position]
+            if not name.startswith(encoded):
+                break
+            matches.append(name)
+            position += 1
+        position = bisect.bisect_left(self._extra_sorted, encoded)
+        for name in self._extra_sorted[position:position + limit]:
+            if not name.startswith(encoded):
+                break
+            matches.append(name)
+        return [name.decode("utf-8") for name in sorted(matches)[:limit]]
+
+    def save(self, path=None):
+        """Compacta altas pendientes y escribe el archivo de forma atómica; el journal vuelve a empezar."""
+        with self._lock:
+            path = path or self.path
+            if self._extra:
+                self._rebuild([])
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(HEADER.pack(MAGIC, self._base_count, self._bloom_bits, BLOOM_HASHES, len(self._table), self._blob.size))
+                f.write(b"\0" * (_pad8(HEADER.size) - HEADER.size))
+                for array in (self._bloom, self._table, self._offsets, self._sorted, self._blob):
+                    data = np.ascontiguousarray(array).tobytes()
+                    f.write(data)
+                    f.write(b"\0" * (_pad8(len(data)) - len(data)))
+            os.replace(tmp, path)
+            if path != self.path and self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            self.path = path
+            self._load(path)
+            # Todo lo anotado ya está en el archivo base (si se cae antes de truncar, reabrir lo ignora)
+            if self._journal is None:
+                self._journal = open(self._journal_path(), "ab")
+            self._journal.truncate(0)
+            self._journaled = 0
+
+    def close(self):
+        """Compacta lo pendiente en el journal y lo cierra."""
+        with self._lock:
+            if self._journal is not None:
+                if self._journaled:
+                    self.save()
+                self._journal.close()
+                self._journal = None
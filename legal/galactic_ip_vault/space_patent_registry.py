@@ -1,7 +1,21 @@
 
+from legal.galactic_ip_vault.patent_store import PatentStore
+
 class GalacticRegistry:
     """Registro preventivo de patentes para tecnología Artemis y recursos LEO."""
-    def __init__(self):
+    def __init__(self, store_path=None):
         self.vault_level = 7
+        self.store = PatentStore(store_path)
     def secure_patent(self, tech_name):
+        if not self.store.add(tech_name):
+            print(f"[LEGAL] Patente '{tech_name}' rechazada: ya existe en el registro.")
+            return False
         print(f"[LEGAL] Patente '{tech_name}' registrada bajo dominio DALabs Harmony.")
+        return True
+    def search(self, prefix, limit=20):
+        return self.store.prefix_search(prefix, limit)
+    def flush(self):
+        if self.store.path:
+            self.store.save()
+    def close(self):
+        self.store.close()
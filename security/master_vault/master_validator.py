@@ -1,17 +1,111 @@
 ﻿# QVE MASTER VALIDATOR - MILITARY LEVEL 7
 # Lead Architect: Daniel Alejandro Andrade Grau
 import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from core.event_log import get_event_log
+from core.timing import timed
+
+class VerifiedKeyCache:
+    """Caché LRU acotada con TTL de verificaciones recientes (solo en memoria del proceso).
+
+    IdentityGuard la indexa por un BLAKE2b con clave secreta del proceso, nunca
+    por la llave en claro, y solo guarda verificaciones exitosas.
+    """
+    def __init__(self, maxsize=4096, ttl=300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            result, expires = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key, result):
+        with self._lock:
+            self._entries[key] = (result, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
 
 class IdentityGuard:
-    def __init__(self):
-        self.master_hash = hashlib.sha256("8903037M2903035CHL170519349720268".encode()).hexdigest()
+    # Caché opcional (cache_size=0 la desactiva, por defecto): el token BLAKE2b con clave cuesta
+    # tanto como el SHA-256 que evita, así que solo conviene si la verificación se encarece
+    def __init__(self, cache_size=0, cache_ttl=300.0, master_hash=None):
+        self.master_hash = master_hash or hashlib.sha256("8903037M2903035CHL170519349720268".encode()).hexdigest()
         self.status = "ARMED"
+        self._master_digest = bytes.fromhex(self.master_hash)
+        self.cache = VerifiedKeyCache(cache_size, cache_ttl) if cache_size else None
+        self._cache_secret = os.urandom(32)  # la caché nunca ve llaves en claro ni digests predecibles
+        self.events = get_event_log()
+
+    def _cache_token(self, input_key):
+        return hashlib.blake2b(input_key.encode(), key=self._cache_secret, digest_size=16).digest()
+
+    def recently_verified(self, input_key):
+        """True si la llave se verificó con éxito dentro del TTL de la caché (sin recalcular el SHA-256)."""
+        return self.cache is not None and self.cache.get(self._cache_token(input_key)) is True
 
+    @timed("identity_guard.verify_authority")
     def verify_authority(self, input_key):
         # Solo la Llave Maestra escrita en la realidad puede abrir este candado
-        check = hashlib.sha256(input_key.encode()).hexdigest()
-        return check == self.master_hash
+        token = None
+        if self.cache is not None:
+            token = self._cache_token(input_key)
+            if self.cache.get(token) is True:
+                return True
+        check = hashlib.sha256(input_key.encode()).digest()
+        result = hmac.compare_digest(check, self._master_digest)
+        # Solo se cachean aciertos: llaves inválidas al azar no desplazan entradas válidas
+        if result and token is not None:
+            self.cache.put(token, True)
+        return result
+
+    @timed("identity_guard.verify_many")
+    def verify_many(self, input_keys, workers=4, batch_size=256):
+        """Verifica un lote de llaves repartiendo el hashing en un pool de hilos.
+
+        hashlib libera el GIL en entradas grandes, así que los lotes de llaves
+        largas escalan con los hilos. Devuelve una lista de bool en el mismo orden.
+        """
+        keys = list(input_keys)
+        if workers <= 1 or len(keys) <= batch_size:
+            return [self.verify_authority(key) for key in keys]
+        batches = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+        from concurrent.futures import ThreadPoolExecutor  # solo para lotes; el camino de una llave no lo carga
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(lambda batch: [self.verify_authority(key) for key in batch], batches)
+        return [result for batch in results for result in batch]
+
+    def invalidate(self, input_key=None):
+        # Revocación explícita: una llave (o toda la caché) vuelve a verificarse con hash
+        if self.cache is not None:
+            self.cache.invalidate(None if input_key is None else self._cache_token(input_key))
 
     def authorize_transaction(self, asset_type, amount):
         if self.status == "ARMED":
-            print(f"ALERTA: Intento de movimiento en {asset_type} por {amount}. Requiere Firma 3.")
+            self.events.warning("security.guard", "ALERTA: Intento de movimiento en {asset_type} por {amount}. Requiere Firma 3.",
+                                asset_type=asset_type, amount=amount)
@@ -0,0 +1,39 @@
+import importlib.util
+import io
+import os
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# El nombre del módulo tiene paréntesis: se carga por ruta
+_spec = importlib.util.spec_from_file_location("btc_layer_3", os.path.join(ROOT, "BTC_Layer_3_(L3).py"))
+btc_layer_3 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(btc_layer_3)
+
+TEXT = "Sector: Energía | Activos: H2O_Token\n" * 1000
+
+class AbsorbIndustryDominionTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = btc_layer_3.Sovereign_Expansion_Engine("TEST")
+        self.expected = self.engine.absorb_industry_dominion(TEXT)
+
+    def test_text_stream_matches_str(self):
+        self.assertEqual(self.engine.absorb_industry_dominion(io.StringIO(TEXT)), self.expected)
+
+    def test_text_file_matches_binary_file(self):
+        with tempfile.TemporaryDirectory() as scratch:
+            path = os.path.join(scratch, "industry.txt")
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(TEXT)
+            with open(path, encoding="utf-8", newline="") as f:
+                self.assertEqual(self.engine.absorb_industry_dominion(f), self.expected)
+            with open(path, "rb") as f:
+                self.assertEqual(self.engine.absorb_industry_dominion(f), self.expected)
+
+    def test_empty_text_stream(self):
+        self.assertEqual(self.engine.absorb_industry_dominion(io.StringIO("")),
+                         self.engine.absorb_industry_dominion(""))
+
+if __name__ == "__main__":
+    unittest.main()